@@ -5,6 +5,8 @@ from pathlib import Path
 # Cache settings
 CACHE_TTL_SECONDS = 30
 CACHE_FILE_PATH = Path("/tmp/cc-fi-cache.json")
+CACHE_MMAP_THRESHOLD_BYTES = 256 * 1024  # mmap cache files larger than this
+CACHE_STAT_MEMO_SECONDS = 1.0  # Reuse cache file stat results for this long
 
 # Session settings
 CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
@@ -14,6 +16,7 @@ SESSION_FILE_EXTENSION = ".jsonl"
 # Message truncation
 MESSAGE_PREVIEW_LENGTH = 60
 MESSAGE_DETAIL_LENGTH = 400  # Doubled from 200 for more preview content
+TRUNCATE_HEAD_FACTOR = 8  # Normalize at most max_length * factor chars when truncating
 
 # Deep search match display
 MAX_PREVIEW_MATCHES = 5  # Maximum matches to show in preview pane
@@ -60,6 +63,7 @@ FZF_HEIGHT_PERCENT = 100
 
 # Performance limits
 MAX_TAIL_LINES_FOR_LAST_MSG = 200  # Increased for sessions with many tool results
+PARALLEL_PARSE_MIN_FILES = 16  # Parse in worker processes when this many files changed
 
 # Deduplication settings
 DEDUPLICATION_STRATEGY = "both"  # Options: "session_id", "fingerprint", "both", "none"
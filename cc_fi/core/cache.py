@@ -1,19 +1,244 @@
 """Cache management with TTL and invalidation."""
 
+import contextlib
 import json
 import logging
+import mmap
+import operator
+import os
+import threading
 import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from types import ModuleType
 
 from cc_fi.constants import (
     CACHE_FILE_PATH,
+    CACHE_MMAP_THRESHOLD_BYTES,
+    CACHE_STAT_MEMO_SECONDS,
     CACHE_TTL_SECONDS,
     DEDUPLICATION_STRATEGY,
 )
+from cc_fi.core.search import get_session_by_id
 from cc_fi.models.session import SessionData
 
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, stdlib json works too
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# C-level sort key; avoids a Python lambda frame per session
+_by_last_modified = operator.attrgetter("last_modified")
+
+# Serializes cache writers so concurrent saves don't race on the rename
+_save_lock = threading.Lock()
+
+# path -> (monotonic time checked, stat result or None when missing)
+_stat_memo: dict[str, tuple[float, os.stat_result | None]] = {}
+
+
+def _cached_stat(path: Path) -> os.stat_result | None:
+    """
+    Stat a path, reusing results (including misses) for a short window.
+
+    @param path Path to stat
+    @returns Stat result, or None if the path doesn't exist
+    @complexity O(1)
+    @pure false - checks filesystem
+    """
+    key = str(path)
+    now = time.monotonic()
+    memo = _stat_memo.get(key)
+    if memo is not None and now - memo[0] < CACHE_STAT_MEMO_SECONDS:
+        return memo[1]
+
+    try:
+        result = os.stat(key)
+    except FileNotFoundError:
+        result = None
+    _stat_memo[key] = (now, result)
+    return result
+
+
+def _forget_stat(path: Path) -> None:
+    """
+    Drop memoized stat result after this process changes the file.
+
+    @param path Path whose memo entry to drop
+    @complexity O(1)
+    @pure false - modifies module state
+    """
+    _stat_memo.pop(str(path), None)
+
+
+def _loads(raw: bytes | memoryview) -> dict:
+    """
+    Decode cache JSON, preferring orjson when it is installed.
+
+    @param raw Raw UTF-8 encoded JSON bytes (or a view over them)
+    @returns Decoded cache dictionary
+    @throws json.JSONDecodeError When raw is malformed
+    @throws ValueError When raw decodes to something other than an object
+    @complexity O(n) where n is len(raw)
+    @pure true
+    """
+    data: object = None
+    if orjson is not None:
+        # orjson rejects escaped lone surrogates; stdlib json accepts them
+        with contextlib.suppress(orjson.JSONDecodeError):
+            data = orjson.loads(raw)
+    if data is None:
+        data = json.loads(bytes(raw))
+    if not isinstance(data, dict):
+        raise ValueError(f"Cache JSON is {type(data).__name__}, expected object")
+    return data
+
+
+def _read_cache_data(cache_path: Path) -> dict:
+    """
+    Read and decode cache file, memory-mapping it when large enough to matter.
+
+    orjson parses straight from the mapped pages, avoiding a second full copy
+    of the file in memory. Small files and the stdlib fallback use a plain read.
+
+    @param cache_path Path to cache file
+    @returns Decoded cache dictionary
+    @throws FileNotFoundError When cache doesn't exist
+    @throws json.JSONDecodeError When cache is malformed
+    @complexity O(n) where n is file size
+    @pure false - reads filesystem
+    """
+    if orjson is None or cache_path.stat().st_size < CACHE_MMAP_THRESHOLD_BYTES:
+        return _loads(cache_path.read_bytes())
+
+    with (
+        cache_path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+    ):
+        return _loads(view)
+
+
+def _dumps(data: dict) -> bytes:
+    """
+    Encode cache dictionary to JSON bytes, preferring orjson when installed.
+
+    Output is compact (no indentation or separator padding) since the cache
+    is only ever machine-read.
+
+    @param data Cache dictionary with JSON-compatible values only
+    @returns UTF-8 encoded JSON bytes
+    @complexity O(n) where n is serialized size
+    @pure true
+    """
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(data)
+            return encoded
+        except orjson.JSONEncodeError:
+            # orjson rejects lone surrogates; stdlib json escapes them
+            pass
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _index_path(cache_path: Path) -> Path:
+    """
+    Path of the sidecar file holding per-session byte offsets into the cache.
+
+    @param cache_path Path to cache file
+    @returns Sibling path with an .idx suffix appended
+    @complexity O(1)
+    @pure true
+    """
+    return cache_path.with_name(f"{cache_path.name}.idx")
+
+
+def _metadata_path(cache_path: Path) -> Path:
+    """
+    Path of the sidecar file holding every cached session without full_content.
+
+    @param cache_path Path to cache file
+    @returns Sibling path with a .meta suffix appended
+    @complexity O(1)
+    @pure true
+    """
+    return cache_path.with_name(f"{cache_path.name}.meta")
+
+
+def _cache_head(timestamp: float) -> bytes:
+    """
+    Leading bytes of a cache file written at the given time.
+
+    @param timestamp Cache write time as stored in the file
+    @returns JSON prefix up to and including the sessions array opening
+    @complexity O(1)
+    @pure true
+    """
+    return b'{"timestamp":%r,"sessions":[' % timestamp
+
+
+def _encode_metadata(
+    sessions: list[SessionData], timestamp: float, cache_size: int
+) -> bytes:
+    """
+    Encode the metadata sidecar: the cached sessions minus full_content.
+
+    @param sessions Sessions readers get back from the cache
+    @param timestamp Write time of the cache this sidecar describes
+    @param cache_size Byte size of the cache this sidecar describes
+    @returns Serialized sidecar
+    @complexity O(n) where n is number of sessions
+    @pure true
+    """
+    items = []
+    for session in sessions:
+        item = session.to_dict()
+        del item["full_content"]
+        items.append(item)
+    return _dumps(
+        {"timestamp": timestamp, "cache_size": cache_size, "sessions": items}
+    )
+
+
+def _encode_cache(
+    sessions: list[SessionData], excluded: list[SessionData], timestamp: float
+) -> tuple[bytes, dict[str, list[int]]]:
+    """
+    Encode cache JSON, recording where each kept session's object lies.
+
+    Sessions are encoded one by one and joined into the same document a
+    single dumps would produce, so the byte span of every entry is known.
+
+    @param sessions Sessions readers get back
+    @param excluded Sessions kept only for incremental re-indexing
+    @param timestamp Write time recorded in the cache
+    @returns (payload, session_id -> [offset, length]) for sessions; the
+        first entry wins if a session ID repeats
+    @complexity O(n) where n is serialized size
+    @pure true
+    """
+    head = _cache_head(timestamp)
+    chunks = [head]
+    offsets: dict[str, list[int]] = {}
+    position = len(head)
+
+    for i, session in enumerate(sessions):
+        if i:
+            chunks.append(b",")
+            position += 1
+        item = _dumps(session.to_dict())
+        offsets.setdefault(session.session_id, [position, len(item)])
+        chunks.append(item)
+        position += len(item)
+
+    chunks.append(b'],"excluded_sessions":[')
+    chunks.append(b",".join(_dumps(session.to_dict()) for session in excluded))
+    chunks.append(b"]}")
+    return b"".join(chunks), offsets
+
 
 def is_cache_valid(cache_path: Path, ttl_seconds: int) -> bool:
     """
@@ -25,13 +250,39 @@ def is_cache_valid(cache_path: Path, ttl_seconds: int) -> bool:
     @complexity O(1)
     @pure false - checks filesystem
     """
-    if not cache_path.exists():
+    stat_result = _cached_stat(cache_path)
+    if stat_result is None:
         return False
 
-    cache_age = time.time() - cache_path.stat().st_mtime
+    cache_age = time.time() - stat_result.st_mtime
     return cache_age < ttl_seconds
 
 
+def iter_cache(cache_path: Path) -> Iterator[SessionData]:
+    """
+    Stream sessions from cache file one at a time.
+
+    Lets callers filter while reconstructing, so sessions that will be
+    discarded are never collected into an intermediate list.
+
+    @param cache_path Path to cache file
+    @returns Iterator of SessionData objects
+    @throws FileNotFoundError When cache doesn't exist
+    @throws json.JSONDecodeError When cache is malformed
+    @complexity O(n) where n is number of sessions
+    @pure false - reads filesystem
+    """
+    cache_data = _read_cache_data(cache_path)
+
+    # Reconstruction stays serial: from_dict is GIL-bound Python (~3us per
+    # session), and a thread pool over it measured roughly 4x slower.
+    count = 0
+    for item in cache_data["sessions"]:
+        yield SessionData.from_dict(item)
+        count += 1
+    logger.info(f"Loaded {count} sessions from cache")
+
+
 def load_cache(cache_path: Path) -> list[SessionData]:
     """
     Load sessions from cache file.
@@ -43,37 +294,179 @@ def load_cache(cache_path: Path) -> list[SessionData]:
     @complexity O(n) where n is number of sessions
     @pure false - reads filesystem
     """
-    with cache_path.open("r", encoding="utf-8") as f:
-        cache_data = json.load(f)
+    return list(iter_cache(cache_path))
 
-    sessions = [SessionData.from_dict(item) for item in cache_data["sessions"]]
-    logger.info(f"Loaded {len(sessions)} sessions from cache")
-    return sessions
 
+def load_indexed_sessions(cache_path: Path) -> dict[str, SessionData]:
+    """
+    Load every parsed session from cache, keyed by session file path.
+
+    Includes sessions excluded by dedup or the empty filter, so an incremental
+    rebuild can reuse any file whose mtime hasn't changed. Missing or
+    unreadable caches yield an empty mapping (everything gets re-parsed).
 
-def save_cache(sessions: list[SessionData], cache_path: Path) -> None:
+    @param cache_path Path to cache file
+    @returns Dict mapping str(file_path) to cached SessionData
+    @complexity O(n) where n is number of cached sessions
+    @pure false - reads filesystem
     """
-    Save sessions to cache file.
+    try:
+        cache_data = _read_cache_data(cache_path)
+        items = cache_data["sessions"] + cache_data.get("excluded_sessions", [])
+        sessions = [SessionData.from_dict(item) for item in items]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"No reusable cache entries: {e}")
+        return {}
 
-    @param sessions List of SessionData to cache
+    return {str(session.file_path): session for session in sessions}
+
+
+def load_cached_session(session_id: str, cache_path: Path) -> SessionData | None:
+    """
+    Load a single session from cache using the offset index.
+
+    Reads and decodes only that session's bytes, so a preview doesn't pay
+    for parsing every conversation in the cache. The index is checked
+    against the cache size and the decoded session ID; anything stale,
+    missing or inconsistent returns None and the caller falls back to a
+    full load.
+
+    @param session_id Session ID to load
     @param cache_path Path to cache file
+    @returns SessionData, or None when the index can't answer
+    @complexity O(k) where k is the size of the session's cache entry
+    @pure false - reads filesystem
+    """
+    try:
+        index = _loads(_index_path(cache_path).read_bytes())
+        span = index["offsets"].get(session_id)
+        if span is None:
+            return None
+        offset, length = span
+
+        with cache_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size != index["cache_size"]:
+                return None
+            f.seek(offset)
+            session = SessionData.from_dict(_loads(f.read(length)))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Cache index unusable: {e}")
+        return None
+
+    return session if session.session_id == session_id else None
+
+
+def load_cached_metadata(cache_path: Path) -> list[SessionData] | None:
+    """
+    Load every cached session without its full_content.
+
+    Reads the metadata sidecar, a small fraction of the cache once
+    conversations are included, for callers that never search or preview
+    content; full_content comes back empty. The sidecar is checked against
+    the cache's write timestamp and size; a stale or missing sidecar returns
+    None and the caller falls back to a full load.
+
+    @param cache_path Path to cache file
+    @returns SessionData list in cache order, or None when unusable
+    @complexity O(n) where n is number of sessions
+    @pure false - reads filesystem
+    """
+    try:
+        metadata = _loads(_metadata_path(cache_path).read_bytes())
+        head = _cache_head(metadata["timestamp"])
+
+        with cache_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size != metadata["cache_size"]:
+                return None
+            if f.read(len(head)) != head:
+                return None
+
+        return [SessionData.from_dict(item) for item in metadata["sessions"]]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Cache metadata unusable: {e}")
+        return None
+
+
+def save_cache(
+    sessions: list[SessionData],
+    cache_path: Path,
+    excluded: list[SessionData] | None = None,
+) -> None:
+    """
+    Save sessions to cache file atomically.
+
+    Writes to a temporary file in the same directory and renames it over the
+    cache, so readers never see a partially written file. An offset index
+    for load_cached_session and a metadata sidecar for load_cached_metadata
+    are written alongside the same way.
+
+    @param sessions List of SessionData to cache (what readers get back)
+    @param cache_path Path to cache file
+    @param excluded Parsed sessions dropped by dedup/filtering, kept only for
+        incremental re-indexing
     @throws OSError When cache directory is not writable
     @complexity O(n) where n is number of sessions
     @pure false - writes to filesystem
     """
-    cache_data = {
-        "timestamp": time.time(),
-        "sessions": [session.to_dict() for session in sessions],
-    }
+    timestamp = time.time()
+    payload, offsets = _encode_cache(sessions, excluded or [], timestamp)
+    index = _dumps({"cache_size": len(payload), "offsets": offsets})
+    metadata = _encode_metadata(sessions, timestamp, len(payload))
 
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with cache_path.open("w", encoding="utf-8") as f:
-        json.dump(cache_data, f, indent=2)
+    writes = (
+        (cache_path, payload),
+        (_index_path(cache_path), index),
+        (_metadata_path(cache_path), metadata),
+    )
+
+    with _save_lock:
+        # Cache first: a reader pairing the new cache with an old sidecar is
+        # caught by the checks in load_cached_session/load_cached_metadata
+        for path, data in writes:
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            finally:
+                _forget_stat(cache_path)
 
     logger.info(f"Cached {len(sessions)} sessions to {cache_path}")
 
 
+def save_cache_in_background(
+    sessions: list[SessionData],
+    cache_path: Path,
+    excluded: list[SessionData] | None = None,
+) -> threading.Thread:
+    """
+    Save sessions to cache file on a background thread.
+
+    The thread is non-daemon so the interpreter waits for the write to finish
+    before exiting; short-lived invocations still leave a complete cache.
+
+    @param sessions List of SessionData to cache (must not be mutated)
+    @param cache_path Path to cache file
+    @param excluded Parsed sessions dropped by dedup/filtering (see save_cache)
+    @returns Started thread performing the write
+    @complexity O(1) on the calling thread
+    @pure false - writes to filesystem
+    """
+
+    def _write() -> None:
+        try:
+            save_cache(sessions, cache_path, excluded)
+        except OSError as e:
+            logger.warning(f"Cache save failed: {e}")
+
+    thread = threading.Thread(target=_write, name="cc-fi-cache-save")
+    thread.start()
+    return thread
+
+
 def has_content(session: SessionData) -> bool:
     """
     Check if session has any meaningful content.
@@ -83,7 +476,7 @@ def has_content(session: SessionData) -> bool:
     @complexity O(1)
     @pure true
     """
-    return bool(session.first_message.strip() or session.last_message.strip())
+    return session.has_content
 
 
 def filter_empty_sessions(sessions: list[SessionData]) -> list[SessionData]:
@@ -95,7 +488,7 @@ def filter_empty_sessions(sessions: list[SessionData]) -> list[SessionData]:
     @complexity O(n) where n is number of sessions
     @pure true
     """
-    return [s for s in sessions if has_content(s)]
+    return [s for s in sessions if s.has_content]
 
 
 def sort_sessions_by_recency(sessions: list[SessionData]) -> list[SessionData]:
@@ -107,16 +500,22 @@ def sort_sessions_by_recency(sessions: list[SessionData]) -> list[SessionData]:
     @complexity O(n log n) where n is number of sessions
     @pure true - does not modify input list
     """
-    return sorted(sessions, key=lambda s: s.last_modified, reverse=True)
+    return sorted(sessions, key=_by_last_modified, reverse=True)
 
 
-def get_sessions_with_cache(force_rebuild: bool = False) -> list[SessionData]:
+def get_sessions_with_cache(
+    force_rebuild: bool = False, with_content: bool = True
+) -> list[SessionData]:
     """
     Get sessions using cache if valid, otherwise rebuild.
 
-    Applies deduplication before filtering and caching.
+    Rebuilds are incremental: session files whose mtime matches the cached
+    entry are reused instead of re-parsed. Applies deduplication before
+    filtering and caching.
 
     @param force_rebuild Force cache rebuild if True
+    @param with_content False lets a valid cache be served from the metadata
+        sidecar, leaving full_content empty; rebuilds always include it
     @returns List of SessionData with content, sorted by recency
     @complexity O(n*m) worst case (rebuild), O(n log n) best case (cache)
     @pure false - may read/write filesystem
@@ -129,31 +528,70 @@ def get_sessions_with_cache(force_rebuild: bool = False) -> list[SessionData]:
 
     if not force_rebuild and is_cache_valid(cache_path, ttl):
         try:
-            sessions = load_cache(cache_path)
-            sessions = filter_empty_sessions(sessions)
+            cached: Iterable[SessionData] | None = (
+                None if with_content else load_cached_metadata(cache_path)
+            )
+            if cached is None:
+                cached = iter_cache(cache_path)
+            # Filter empties while loading instead of in a second pass
+            sessions = [s for s in cached if s.has_content]
             return sort_sessions_by_recency(sessions)
         except Exception as e:
             logger.warning(f"Cache load failed: {e}, rebuilding")
 
-    sessions = index_sessions(force_rebuild=force_rebuild)
+    previous = {} if force_rebuild else load_indexed_sessions(cache_path)
+    indexed = index_sessions(force_rebuild=force_rebuild, previous=previous)
 
     # Deduplicate before filtering empty sessions
     deduplicator = SessionDeduplicator()
-    sessions = deduplicator.deduplicate(sessions, strategy=DEDUPLICATION_STRATEGY)
+    sessions = deduplicator.deduplicate(indexed, strategy=DEDUPLICATION_STRATEGY)
 
     sessions = filter_empty_sessions(sessions)
-    save_cache(sessions, cache_path)
+
+    kept = {id(session) for session in sessions}
+    excluded = [session for session in indexed if id(session) not in kept]
+    save_cache_in_background(sessions, cache_path, excluded)
     return sessions
 
 
+def get_session_with_cache(session_id: str) -> SessionData | None:
+    """
+    Get one session by ID, loading only its entry when the cache is valid.
+
+    Used by the per-keystroke preview process. Falls back to the full
+    get_sessions_with_cache path (including rebuilds) whenever the cache
+    is expired or its index can't answer.
+
+    @param session_id Session ID to look up
+    @returns SessionData if found, None otherwise
+    @complexity O(k) with a valid indexed cache where k is the entry size,
+        otherwise as get_sessions_with_cache
+    @pure false - may read/write filesystem
+    """
+    cache_path = CACHE_FILE_PATH
+
+    if is_cache_valid(cache_path, CACHE_TTL_SECONDS):
+        session = load_cached_session(session_id, cache_path)
+        if session is not None:
+            return session
+
+    return get_session_by_id(get_sessions_with_cache(), session_id)
+
+
 def invalidate_cache(cache_path: Path = CACHE_FILE_PATH) -> None:
     """
-    Delete cache file if it exists.
+    Delete cache file (and its sidecar files) if it exists.
 
     @param cache_path Path to cache file
     @complexity O(1)
     @pure false - modifies filesystem
     """
-    if cache_path.exists():
-        cache_path.unlink()
-        logger.info(f"Cache invalidated: {cache_path}")
+    _forget_stat(cache_path)
+    for sidecar in (_index_path(cache_path), _metadata_path(cache_path)):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(sidecar)
+    try:
+        os.unlink(cache_path)
+    except FileNotFoundError:
+        return
+    logger.info(f"Cache invalidated: {cache_path}")
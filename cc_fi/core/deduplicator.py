@@ -27,13 +27,11 @@ class SessionDeduplicator:
 
         for session in sessions:
             session_id = session.session_id
-            if session_id not in seen_ids:
+            existing = seen_ids.get(session_id)
+            # Keep the one with higher last_modified. Callers pass sessions
+            # sorted newest-first, so the replacement branch is rarely taken.
+            if existing is None or session.last_modified > existing.last_modified:
                 seen_ids[session_id] = session
-            else:
-                # Keep the one with higher last_modified
-                existing = seen_ids[session_id]
-                if session.last_modified > existing.last_modified:
-                    seen_ids[session_id] = session
 
         return list(seen_ids.values())
 
@@ -50,15 +48,56 @@ class SessionDeduplicator:
         @complexity O(n)
         @pure true
         """
-        seen_fingerprints: dict[tuple, "SessionData"] = {}
+        # A plain set is already a hash-first prefilter: lookups compare the
+        # stored hash before falling back to tuple equality, so non-duplicates
+        # never compare strings. A separate hash()/Bloom layer would only add
+        # a second lookup per session.
+        seen_fingerprints: set[tuple] = set()
+        result = []
 
         for session in sessions:
             fingerprint = session.content_fingerprint
-            if fingerprint not in seen_fingerprints:
-                seen_fingerprints[fingerprint] = session
             # Keep first occurrence, discard duplicates
+            if fingerprint not in seen_fingerprints:
+                seen_fingerprints.add(fingerprint)
+                result.append(session)
+
+        return result
+
+    def deduplicate_both(
+        self, sessions: list["SessionData"]
+    ) -> list["SessionData"]:
+        """
+        Deduplicate by session_id, then by fingerprint, without an intermediate list.
+
+        Equivalent to deduplicate_by_fingerprint(deduplicate_by_session_id(...)).
+        The fingerprint filter reads the session_id winners straight from the
+        dict view. A single pass with two sets would only be correct for
+        newest-first input, and this method accepts any order.
+
+        @param sessions List of sessions to deduplicate
+        @returns Deduplicated list (session_id and fingerprint unique)
+        @complexity O(n)
+        @pure true
+        """
+        seen_ids: dict[str, "SessionData"] = {}
 
-        return list(seen_fingerprints.values())
+        for session in sessions:
+            session_id = session.session_id
+            existing = seen_ids.get(session_id)
+            if existing is None or session.last_modified > existing.last_modified:
+                seen_ids[session_id] = session
+
+        seen_fingerprints: set[tuple] = set()
+        result = []
+
+        for session in seen_ids.values():
+            fingerprint = session.content_fingerprint
+            if fingerprint not in seen_fingerprints:
+                seen_fingerprints.add(fingerprint)
+                result.append(session)
+
+        return result
 
     def deduplicate(
         self, sessions: list["SessionData"], strategy: str = "both"
@@ -82,13 +121,10 @@ class SessionDeduplicator:
         elif strategy == "fingerprint":
             result = self.deduplicate_by_fingerprint(sessions)
         elif strategy == "both":
-            # Apply both strategies sequentially
-            result = self.deduplicate_by_session_id(sessions)
-            result = self.deduplicate_by_fingerprint(result)
+            result = self.deduplicate_both(sessions)
         else:
             logger.warning(f"Unknown deduplication strategy: {strategy}, using 'both'")
-            result = self.deduplicate_by_session_id(sessions)
-            result = self.deduplicate_by_fingerprint(result)
+            result = self.deduplicate_both(sessions)
 
         removed_count = original_count - len(result)
         if removed_count > 0:
@@ -1,6 +1,7 @@
 """Centralized filtering system for boilerplate messages."""
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -16,6 +17,13 @@ class BoilerplatePattern:
     pattern_type: str
     pattern: str
     case_sensitive: bool = False
+    # Pattern as compared against text: lowercased once if case-insensitive
+    match_string: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.match_string = (
+            self.pattern if self.case_sensitive else self.pattern.lower()
+        )
 
 
 # Centralized registry of boilerplate patterns
@@ -49,11 +57,10 @@ def matches_pattern(text: str, pattern: BoilerplatePattern) -> bool:
     @pure true
     """
     text_to_check = text.strip()
-    pattern_str = pattern.pattern
+    pattern_str = pattern.match_string
 
     if not pattern.case_sensitive:
         text_to_check = text_to_check.lower()
-        pattern_str = pattern_str.lower()
 
     if pattern.pattern_type == "prefix":
         return text_to_check.startswith(pattern_str)
@@ -65,16 +72,70 @@ def matches_pattern(text: str, pattern: BoilerplatePattern) -> bool:
     return False
 
 
+def compile_patterns(patterns: list[BoilerplatePattern]) -> re.Pattern[str]:
+    """
+    Compile pattern registry into a single alternation regex.
+
+    Prefix and comment patterns are anchored at the start of the text (after
+    leading whitespace, mirroring matches_pattern's strip), xml_tag patterns
+    match anywhere. Case-insensitive patterns use a scoped (?i:...) group so
+    one regex covers both kinds.
+
+    @param patterns Patterns to compile
+    @returns Compiled regex that searches for any pattern
+    @complexity O(n) where n is number of patterns
+    @pure true
+    """
+    alternatives = []
+    for pattern in patterns:
+        escaped = re.escape(pattern.pattern)
+        if not pattern.case_sensitive:
+            escaped = f"(?i:{escaped})"
+        if pattern.pattern_type in ("prefix", "comment"):
+            escaped = rf"\A\s*{escaped}"
+        elif pattern.pattern_type != "xml_tag":
+            continue
+        alternatives.append(escaped)
+
+    if not alternatives:
+        return re.compile(r"(?!)")  # Never matches
+    return re.compile("|".join(alternatives))
+
+
+# Registry snapshot and the regex compiled from it; see _boilerplate_regex
+_compiled_registry: tuple[BoilerplatePattern, ...] = ()
+_BOILERPLATE_RE = compile_patterns([])
+
+
+def _boilerplate_regex() -> re.Pattern[str]:
+    """
+    Return the regex for the current BOILERPLATE_PATTERNS, recompiling on change.
+
+    The registry list can be extended after import, so the compiled regex is
+    keyed on a snapshot of it. Comparing the snapshot is cheap: unchanged
+    entries are the same objects, so the tuple comparison short-circuits on
+    identity.
+
+    @returns Compiled alternation regex for the registry
+    @complexity O(p) where p is number of patterns; O(p) compile on change
+    @pure false - updates the module-level compiled regex
+    """
+    global _compiled_registry, _BOILERPLATE_RE
+
+    registry = tuple(BOILERPLATE_PATTERNS)
+    if registry != _compiled_registry:
+        _BOILERPLATE_RE = compile_patterns(list(registry))
+        _compiled_registry = registry
+    return _BOILERPLATE_RE
+
+
 def is_boilerplate(text: str) -> bool:
     """
     Check if message text matches any boilerplate pattern.
 
     @param text Message text to check
     @returns True if text matches any registered pattern
-    @complexity O(n) where n is number of patterns
+    @complexity O(n) where n is text length (single regex scan)
     @pure true
     """
-    for pattern in BOILERPLATE_PATTERNS:
-        if matches_pattern(text, pattern):
-            return True
-    return False
+    return _boilerplate_regex().search(text) is not None
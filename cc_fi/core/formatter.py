@@ -1,7 +1,9 @@
 """Output formatting for sessions."""
 
+import functools
+import os
+import re
 import shutil
-import textwrap
 from datetime import datetime
 from pathlib import Path
 
@@ -25,16 +27,149 @@ from cc_fi.constants import (
     ICON_FIRST,
     ICON_BRANCH,
     ICON_SESSION,
+    MATCH_CONTEXT_CHARS,
+    MAX_PREVIEW_MATCHES,
     MESSAGE_DETAIL_LENGTH,
     MESSAGE_PREVIEW_LENGTH,
     PATH_COLUMN_WIDTH,
     PROJECT_COLUMN_WIDTH,
     TIME_COLUMN_WIDTH,
+    TRUNCATE_HEAD_FACTOR,
 )
 from cc_fi.models.session import SessionData
 
+# SGR/CSI escape sequences; zero-width when measuring wrapped lines
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+# Prefix for fuzzy-matched characters (red + bold for visibility)
+_HIGHLIGHT_START = COLOR_RED + COLOR_BOLD
+
+# Resolved once: Path.home() goes through expanduser/pwd on every call.
+# The prefix ends in a separator so /home/userfoo isn't treated as under
+# /home/user; os.path.join also copes with a home of "/".
+_HOME = str(Path.home())
+_HOME_PREFIX = os.path.join(_HOME, "")
+_HOME_PREFIX_LEN = len(_HOME_PREFIX) - 1
+
+_TIMESTAMP_FORMAT = "%b %d, %I:%M %p"
+
+# Column templates for list view, filled with a single % operation per row.
+# Fixed columns truncate and pad in one step (%-W.Ws); the dynamic RECENT and
+# FIRST columns are padded to a width passed alongside the value (%-*s).
+_FIXED_COLUMN_SPECS = (
+    f"%-{PROJECT_COLUMN_WIDTH}.{PROJECT_COLUMN_WIDTH}s",
+    f"%-{PATH_COLUMN_WIDTH}.{PATH_COLUMN_WIDTH}s",
+    f"%-{TIME_COLUMN_WIDTH}s",
+)
+_ROW_TEMPLATE = (
+    f"{COLOR_GREEN}{_FIXED_COLUMN_SPECS[0]}{COLOR_RESET}  "
+    f"{COLOR_BLUE}{_FIXED_COLUMN_SPECS[1]}{COLOR_RESET}  "
+    f"{COLOR_YELLOW}{_FIXED_COLUMN_SPECS[2]}{COLOR_RESET}  "
+    f"{COLOR_MAUVE}%-*s{COLOR_RESET}  "
+    f"{COLOR_LAVENDER}%-*s{COLOR_RESET}"
+)
+_HEADER_TEMPLATE = (
+    f"{COLOR_BOLD}{COLOR_GREEN}{_FIXED_COLUMN_SPECS[0]}{COLOR_RESET}  "
+    f"{COLOR_BOLD}{COLOR_BLUE}{_FIXED_COLUMN_SPECS[1]}{COLOR_RESET}  "
+    f"{COLOR_BOLD}{COLOR_YELLOW}{_FIXED_COLUMN_SPECS[2]}{COLOR_RESET}  "
+    f"{COLOR_BOLD}{COLOR_MAUVE}%-*s{COLOR_RESET}  "
+    f"{COLOR_BOLD}{COLOR_LAVENDER}%-*s{COLOR_RESET}"
+)
+
+# Preview pane lines: label and colors are fixed, only the value is filled in
+_PROJECT_LINE = (
+    f"{COLOR_BOLD}{COLOR_GREEN}{ICON_PROJECT} Project:{COLOR_RESET}     "
+    f"{COLOR_GREEN}%s{COLOR_RESET}"
+)
+_PATH_LINE = (
+    f"{COLOR_BOLD}{COLOR_BLUE}{ICON_FOLDER} Path:{COLOR_RESET}        "
+    f"{COLOR_BLUE}%s{COLOR_RESET}"
+)
+_BRANCH_LINE = (
+    f"{COLOR_BOLD}{COLOR_GREEN}{ICON_BRANCH} Branch:{COLOR_RESET}      "
+    f"{COLOR_GREEN}%s{COLOR_RESET}"
+)
+_TIME_LINE = (
+    f"{COLOR_BOLD}{COLOR_YELLOW}{ICON_CLOCK} Time:{COLOR_RESET}        "
+    f"{COLOR_YELLOW}%s{COLOR_RESET}"
+)
+_SESSION_LINES = (
+    f"{COLOR_BOLD}{COLOR_GRAY}{ICON_SESSION} Session:{COLOR_RESET}     "
+    f"{COLOR_GRAY}%s{COLOR_RESET}\n"
+    f"{COLOR_BOLD}{COLOR_GRAY}{ICON_COMMENT} Messages:{COLOR_RESET}    "
+    f"{COLOR_GRAY}%s{COLOR_RESET}"
+)
+_RECENT_HEADING = f"{COLOR_BOLD}{COLOR_MAUVE}{ICON_RECENT} Recent Msg:{COLOR_RESET}"
+_FIRST_HEADING = f"{COLOR_BOLD}{COLOR_LAVENDER}{ICON_FIRST} First Msg:{COLOR_RESET}"
+_MATCH_PREFIX = f"{COLOR_BOLD}{COLOR_LAVENDER} [Match %d]{COLOR_RESET} %s"
+_MATCH_INDENT = " " * 10
+
+# Whole browse-mode preview (table order: project, path, [branch], time,
+# recent, first, session info), so format_fzf_preview is one % operation
+_PREVIEW_TAIL = "\n".join(
+    [
+        _TIME_LINE,
+        "",
+        _RECENT_HEADING,
+        "%s",
+        "",
+        _FIRST_HEADING,
+        "%s",
+        "",
+        _SESSION_LINES,
+    ]
+)
+_PREVIEW_TEMPLATE = "\n".join([_PROJECT_LINE, _PATH_LINE, _PREVIEW_TAIL])
+_PREVIEW_BRANCH_TEMPLATE = "\n".join(
+    [_PROJECT_LINE, _PATH_LINE, _BRANCH_LINE, _PREVIEW_TAIL]
+)
+
+# Interactive-mode instructions (Catppuccin Blue highlights for key terms)
+# plus a note about search scope; fixed text, so built once
+_INSTRUCTION_HEADER = (
+    f"{COLOR_OVERLAY0}Type to {COLOR_CATPPUCCIN_BLUE}search{COLOR_OVERLAY0} | "
+    f"↑↓ {COLOR_CATPPUCCIN_BLUE}Navigate{COLOR_OVERLAY0} | "
+    f"↵ {COLOR_CATPPUCCIN_BLUE}Select{COLOR_OVERLAY0} | "
+    f"Esc {COLOR_CATPPUCCIN_BLUE}Cancel{COLOR_RESET}\n"
+    f"{COLOR_OVERLAY0}Searching visible fields + conversation content{COLOR_RESET}"
+)
+
+
+# Memoized (recent_width, first_width); see reset_column_width_cache
+_column_widths: tuple[int, int] | None = None
+
+
+def reset_column_width_cache() -> None:
+    """
+    Forget memoized column widths so the next render re-reads terminal size.
+
+    Call at the start of each render pass (list output, fzf input).
+
+    @complexity O(1)
+    @pure false - modifies module state
+    """
+    global _column_widths
+    _column_widths = None
+
 
 def get_dynamic_column_widths() -> tuple[int, int]:
+    """
+    Get dynamic widths for RECENT and FIRST columns, memoized per render pass.
+
+    Every row needs the same widths, so the terminal size is queried once
+    rather than once per row (see reset_column_width_cache).
+
+    @returns Tuple of (recent_width, first_width)
+    @complexity O(1)
+    @pure false - reads terminal size on first call
+    """
+    global _column_widths
+    if _column_widths is None:
+        _column_widths = _measure_column_widths()
+    return _column_widths
+
+
+def _measure_column_widths() -> tuple[int, int]:
     """
     Calculate dynamic widths for RECENT and FIRST columns based on terminal width.
 
@@ -85,11 +220,29 @@ def normalize_whitespace(text: str) -> str:
     @complexity O(n) where n is text length
     @pure true
     """
-    import re
+    # str.split() drops leading/trailing whitespace and splits on the same
+    # characters as regex \s; the split/join runs in C without a regex engine
+    # and is ~3x faster than re.sub + strip, even on already-clean text
+    return " ".join(text.split())
+
+
+def lower_preserving_positions(text: str) -> str:
+    """
+    Lowercase text so that every index still lines up with the original.
+
+    str.lower() can lengthen a string (e.g. "İ" becomes two code points),
+    which would shift positions found in the lowered copy away from the
+    characters they came from. Such characters are left as-is instead.
 
-    normalized = text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
-    normalized = re.sub(r"\s+", " ", normalized)
-    return normalized.strip()
+    @param text Text to lowercase
+    @returns Lowercased text with len() equal to len(text)
+    @complexity O(n) where n is text length
+    @pure true
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
 
 
 def highlight_fuzzy_matches(text: str, query: str) -> str:
@@ -109,15 +262,18 @@ def highlight_fuzzy_matches(text: str, query: str) -> str:
         return text
 
     query_lower = query.lower()
-    text_lower = text.lower()
+    text_lower = lower_preserving_positions(text)
 
-    # Find positions of fuzzy matches (greedy: first occurrence of each char)
+    # Find positions of fuzzy matches (greedy: first occurrence of each char).
+    # One C-level find per query char; each resumes where the last stopped,
+    # so text is scanned at most once overall and misses bail out early.
     matched_positions = []
     search_pos = 0
+    find = text_lower.find
 
     for query_char in query_lower:
         # Find next occurrence of this character
-        pos = text_lower.find(query_char, search_pos)
+        pos = find(query_char, search_pos)
         if pos == -1:
             # No complete fuzzy match found, return text unchanged
             return text
@@ -130,13 +286,25 @@ def highlight_fuzzy_matches(text: str, query: str) -> str:
 
     result = []
     last_pos = 0
-
-    for pos in matched_positions:
-        # Add text before match
-        result.append(text[last_pos:pos])
-        # Add highlighted character (red + bold for visibility)
-        result.append(f"{COLOR_RED}{COLOR_BOLD}{text[pos]}{COLOR_RESET}")
-        last_pos = pos + 1
+    index = 0
+    match_count = len(matched_positions)
+
+    while index < match_count:
+        # Extend over consecutive positions so a contiguous run gets a single
+        # color/reset pair instead of one per character
+        run_start = matched_positions[index]
+        run_end = run_start + 1
+        index += 1
+        while index < match_count and matched_positions[index] == run_end:
+            run_end += 1
+            index += 1
+
+        # Add text before match, then the highlighted run (red + bold)
+        result.append(text[last_pos:run_start])
+        result.append(_HIGHLIGHT_START)
+        result.append(text[run_start:run_end])
+        result.append(COLOR_RESET)
+        last_pos = run_end
 
     # Add remaining text
     result.append(text[last_pos:])
@@ -151,9 +319,18 @@ def truncate_message(message: str, max_length: int) -> str:
     @param message Message text to truncate
     @param max_length Maximum length (including ellipsis)
     @returns Truncated message with normalized whitespace
-    @complexity O(n) where n is max_length
+    @complexity O(n) where n is max_length (typical), message length worst case
     @pure true
     """
+    # Only normalize a bounded head of long messages. The slack absorbs
+    # collapsed whitespace; if the head collapses below max_length we can't
+    # tell whether truncation is needed, so fall back to the whole message.
+    head_length = max_length * TRUNCATE_HEAD_FACTOR
+    if len(message) > head_length:
+        normalized = normalize_whitespace(message[:head_length])
+        if len(normalized) > max_length:
+            return normalized[: max_length - 3] + "..."
+
     normalized = normalize_whitespace(message)
 
     if len(normalized) <= max_length:
@@ -162,6 +339,61 @@ def truncate_message(message: str, max_length: int) -> str:
     return normalized[: max_length - 3] + "..."
 
 
+def _visible_len(text: str) -> int:
+    """
+    Count characters that occupy a terminal column, skipping ANSI escapes.
+
+    Every escape sequence starts with ESC, so text without one is measured
+    with len() alone. In highlighted text most words carry no color codes.
+
+    @param text Text that may contain ANSI escape sequences
+    @returns Number of visible characters
+    @complexity O(n) where n is text length
+    @pure true
+    """
+    if "\x1b" not in text:
+        return len(text)
+    return len(_ANSI_RE.sub("", text))
+
+
+def _wrap_words(text: str, width: int) -> list[str]:
+    """
+    Greedily pack whitespace-separated words into lines of at most width columns.
+
+    Same line breaks as textwrap.wrap(break_long_words=False,
+    break_on_hyphens=False) on plain text, but ANSI escape sequences don't
+    count toward the width, so highlighted text fills the line too. Words
+    wider than width get a line to themselves.
+
+    @param text Text to wrap (may contain ANSI color codes)
+    @param width Maximum visible width per line
+    @returns List of lines without trailing newlines
+    @complexity O(n) where n is text length
+    @pure true
+    """
+    # Plain text (the common case) needs no escape-aware measuring
+    measure = len if "\x1b" not in text else _visible_len
+
+    lines: list[str] = []
+    current: list[str] = []
+    current_len = 0
+    for word in text.split():
+        word_len = measure(word)
+        if current and current_len + 1 + word_len > width:
+            lines.append(" ".join(current))
+            current = [word]
+            current_len = word_len
+        elif current:
+            current.append(word)
+            current_len += 1 + word_len
+        else:
+            current.append(word)
+            current_len = word_len
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
 def wrap_colored_text(text: str, color: str, width: int) -> str:
     """
     Wrap text to specified width while preserving color codes.
@@ -175,13 +407,7 @@ def wrap_colored_text(text: str, color: str, width: int) -> str:
     """
     normalized = normalize_whitespace(text)
 
-    # Wrap the text
-    wrapped_lines = textwrap.wrap(
-        normalized,
-        width=width,
-        break_long_words=False,
-        break_on_hyphens=False
-    )
+    wrapped_lines = _wrap_words(normalized, width)
 
     # Apply color to each line
     colored_lines = [f"{color}{line}{COLOR_RESET}" for line in wrapped_lines]
@@ -204,14 +430,8 @@ def wrap_text_preserve_colors(text: str, width: int) -> str:
     """
     normalized = normalize_whitespace(text)
 
-    # Wrap the text - textwrap doesn't count ANSI codes toward width
-    # so this works correctly even with color codes in the text
-    wrapped_lines = textwrap.wrap(
-        normalized,
-        width=width,
-        break_long_words=False,
-        break_on_hyphens=False
-    )
+    # ANSI codes are zero-width here, unlike textwrap which counts every byte
+    wrapped_lines = _wrap_words(normalized, width)
 
     return "\n".join(wrapped_lines)
 
@@ -225,21 +445,45 @@ def format_timestamp(dt: datetime) -> str:
     @complexity O(1)
     @pure true
     """
-    return dt.strftime("%b %d, %I:%M %p")
+    return _format_minute(dt.month, dt.day, dt.hour, dt.minute)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_minute(month: int, day: int, hour: int, minute: int) -> str:
+    """
+    Format the wall-clock fields used by format_timestamp (memoized).
 
+    Keyed on the fields rather than the datetime itself: aware datetimes in
+    different zones can compare equal while rendering differently. Year 2000
+    is a leap year, so Feb 29 is representable.
 
+    @param month Month (1-12)
+    @param day Day of month
+    @param hour Hour (0-23)
+    @param minute Minute (0-59)
+    @returns Formatted string like "Nov 05, 10:00 PM"
+    @complexity O(1)
+    @pure true
+    """
+    return datetime(2000, month, day, hour, minute).strftime(_TIMESTAMP_FORMAT)
+
+
+@functools.lru_cache(maxsize=1024)
 def shorten_path(path: str) -> str:
     """
     Shorten path by replacing home directory with ~.
 
+    Memoized since many sessions share the same project directory.
+
     @param path Full path string
     @returns Shortened path
-    @complexity O(n) where n is path length
+    @complexity O(1) amortized, O(n) on first call where n is path length
     @pure true
     """
-    home = str(Path.home())
-    if path.startswith(home):
-        return path.replace(home, "~", 1)
+    if path.startswith(_HOME_PREFIX):
+        return "~" + path[_HOME_PREFIX_LEN:]
+    if path == _HOME:
+        return "~"
     return path
 
 
@@ -254,9 +498,6 @@ def format_list_row(session: SessionData) -> str:
     """
     recent_width, first_width = get_dynamic_column_widths()
 
-    project = session.project_name[:PROJECT_COLUMN_WIDTH].ljust(PROJECT_COLUMN_WIDTH)
-    path = shorten_path(session.cwd)[:PATH_COLUMN_WIDTH].ljust(PATH_COLUMN_WIDTH)
-    time_str = format_timestamp(session.timestamp).ljust(TIME_COLUMN_WIDTH)
 
     # Extract recent and first messages - use _full fields for table display
     # (first_message/last_message are pre-truncated to 60 chars, but dynamic
@@ -264,19 +505,21 @@ def format_list_row(session: SessionData) -> str:
     recent_msg = session.last_message_full.strip() if session.last_message_full else ""
     if not recent_msg:
         recent_msg = "(no recent message)"
-    recent = truncate_message(recent_msg, recent_width).ljust(recent_width)
+    recent = truncate_message(recent_msg, recent_width)
 
     first_msg = session.first_message_full.strip() if session.first_message_full else ""
     if not first_msg:
         first_msg = "(no first message)"
-    first = truncate_message(first_msg, first_width).ljust(first_width)
-
-    return (
-        f"{COLOR_GREEN}{project}{COLOR_RESET}  "
-        f"{COLOR_BLUE}{path}{COLOR_RESET}  "
-        f"{COLOR_YELLOW}{time_str}{COLOR_RESET}  "
-        f"{COLOR_MAUVE}{recent}{COLOR_RESET}  "
-        f"{COLOR_LAVENDER}{first}{COLOR_RESET}"
+    first = truncate_message(first_msg, first_width)
+
+    return _ROW_TEMPLATE % (
+        session.project_name,
+        shorten_path(session.cwd),
+        format_timestamp(session.timestamp),
+        recent_width,
+        recent,
+        first_width,
+        first,
     )
 
 
@@ -288,21 +531,7 @@ def format_list_header() -> str:
     @complexity O(1)
     @pure false - reads terminal size
     """
-    recent_width, first_width = get_dynamic_column_widths()
-
-    project = f"{ICON_PROJECT} PROJECT".ljust(PROJECT_COLUMN_WIDTH)
-    path = f"{ICON_FOLDER} PATH".ljust(PATH_COLUMN_WIDTH)
-    time_str = f"{ICON_CLOCK} TIME".ljust(TIME_COLUMN_WIDTH)
-    recent = f"{ICON_RECENT} RECENT MSG".ljust(recent_width)
-    first = f"{ICON_FIRST} FIRST MSG".ljust(first_width)
-
-    return (
-        f"{COLOR_BOLD}{COLOR_GREEN}{project}{COLOR_RESET}  "
-        f"{COLOR_BOLD}{COLOR_BLUE}{path}{COLOR_RESET}  "
-        f"{COLOR_BOLD}{COLOR_YELLOW}{time_str}{COLOR_RESET}  "
-        f"{COLOR_BOLD}{COLOR_MAUVE}{recent}{COLOR_RESET}  "
-        f"{COLOR_BOLD}{COLOR_LAVENDER}{first}{COLOR_RESET}"
-    )
+    return _render_header_lines(*get_dynamic_column_widths())[0]
 
 
 def format_header_separator() -> str:
@@ -313,21 +542,42 @@ def format_header_separator() -> str:
     @complexity O(1)
     @pure false - reads terminal size
     """
-    recent_width, first_width = get_dynamic_column_widths()
+    return _render_header_lines(*get_dynamic_column_widths())[1]
 
-    project_sep = "─" * PROJECT_COLUMN_WIDTH
-    path_sep = "─" * PATH_COLUMN_WIDTH
-    time_sep = "─" * TIME_COLUMN_WIDTH
-    recent_sep = "─" * recent_width
-    first_sep = "─" * first_width
 
-    return (
-        f"{COLOR_GREEN}{project_sep}{COLOR_RESET}  "
-        f"{COLOR_BLUE}{path_sep}{COLOR_RESET}  "
-        f"{COLOR_YELLOW}{time_sep}{COLOR_RESET}  "
-        f"{COLOR_MAUVE}{recent_sep}{COLOR_RESET}  "
-        f"{COLOR_LAVENDER}{first_sep}{COLOR_RESET}"
+@functools.lru_cache(maxsize=16)
+def _render_header_lines(recent_width: int, first_width: int) -> tuple[str, str]:
+    """
+    Render the list header and its separator for given column widths (memoized).
+
+    Widths only change when the terminal is resized, so both lines are
+    built together once per width pair.
+
+    @param recent_width Width of RECENT MSG column
+    @param first_width Width of FIRST MSG column
+    @returns (header, separator) tuple
+    @complexity O(w) on first call where w is total width, O(1) after
+    @pure true
+    """
+    header = _HEADER_TEMPLATE % (
+        f"{ICON_PROJECT} PROJECT",
+        f"{ICON_FOLDER} PATH",
+        f"{ICON_CLOCK} TIME",
+        recent_width,
+        f"{ICON_RECENT} RECENT MSG",
+        first_width,
+        f"{ICON_FIRST} FIRST MSG",
     )
+    separator = _ROW_TEMPLATE % (
+        "─" * PROJECT_COLUMN_WIDTH,
+        "─" * PATH_COLUMN_WIDTH,
+        "─" * TIME_COLUMN_WIDTH,
+        recent_width,
+        "─" * recent_width,
+        first_width,
+        "─" * first_width,
+    )
+    return header, separator
 
 
 def format_instruction_header() -> str:
@@ -338,17 +588,7 @@ def format_instruction_header() -> str:
     @complexity O(1)
     @pure true
     """
-    # Instruction text with Catppuccin Blue highlights for key terms
-    instructions = (
-        f"{COLOR_OVERLAY0}Type to {COLOR_CATPPUCCIN_BLUE}search{COLOR_OVERLAY0} | "
-        f"↑↓ {COLOR_CATPPUCCIN_BLUE}Navigate{COLOR_OVERLAY0} | "
-        f"↵ {COLOR_CATPPUCCIN_BLUE}Select{COLOR_OVERLAY0} | "
-        f"Esc {COLOR_CATPPUCCIN_BLUE}Cancel{COLOR_RESET}"
-    )
-    # Note about search scope
-    search_note = f"{COLOR_OVERLAY0}Searching visible fields + conversation content{COLOR_RESET}"
-
-    return f"{instructions}\n{search_note}"
+    return _INSTRUCTION_HEADER
 
 
 def format_fzf_preview(session: SessionData, query: str = "") -> str:
@@ -388,42 +628,35 @@ def format_fzf_preview(session: SessionData, query: str = "") -> str:
         first_msg_wrapped = wrap_colored_text(session.first_message_full, COLOR_LAVENDER, terminal_width)
         last_msg_wrapped = wrap_colored_text(session.last_message_full, COLOR_MAUVE, terminal_width)
 
-    # Start with project, path, time (matching table order)
     # Values are colored to match their header color for easy visual correlation
-    lines = [
-        f"{COLOR_BOLD}{COLOR_GREEN}{ICON_PROJECT} Project:{COLOR_RESET}     {COLOR_GREEN}{project_display}{COLOR_RESET}",
-        f"{COLOR_BOLD}{COLOR_BLUE}{ICON_FOLDER} Path:{COLOR_RESET}        {COLOR_BLUE}{path_display}{COLOR_RESET}",
-    ]
-
-    # Add branch if it exists (between path and time)
-    if session.git_branch:
-        lines.append(f"{COLOR_BOLD}{COLOR_GREEN}{ICON_BRANCH} Branch:{COLOR_RESET}      {COLOR_GREEN}{branch_display}{COLOR_RESET}")
-
-    # Continue with time, recent, first (matching table order)
-    lines.extend(
-        [
-            f"{COLOR_BOLD}{COLOR_YELLOW}{ICON_CLOCK} Time:{COLOR_RESET}        {COLOR_YELLOW}{time_str}{COLOR_RESET}",
-            "",
-            f"{COLOR_BOLD}{COLOR_MAUVE}{ICON_RECENT} Recent Msg:{COLOR_RESET}",
-            last_msg_wrapped,
-            "",
-            f"{COLOR_BOLD}{COLOR_LAVENDER}{ICON_FIRST} First Msg:{COLOR_RESET}",
-            first_msg_wrapped,
-            "",
-            f"{COLOR_BOLD}{COLOR_GRAY}{ICON_SESSION} Session:{COLOR_RESET}     {COLOR_GRAY}{session.session_id}{COLOR_RESET}",
-            f"{COLOR_BOLD}{COLOR_GRAY}{ICON_COMMENT} Messages:{COLOR_RESET}    {COLOR_GRAY}{session.message_count}{COLOR_RESET}",
-        ]
+    tail = (
+        time_str,
+        last_msg_wrapped,
+        first_msg_wrapped,
+        session.session_id,
+        session.message_count,
     )
-
-    return "\n".join(lines)
+    if session.git_branch:
+        return _PREVIEW_BRANCH_TEMPLATE % (
+            project_display, path_display, branch_display, *tail
+        )
+    return _PREVIEW_TEMPLATE % (project_display, path_display, *tail)
 
 
-def find_search_matches(text: str, query: str) -> list[tuple[int, int]]:
+def find_search_matches(
+    text: str,
+    query: str,
+    text_lower: str | None = None,
+    limit: int | None = None,
+) -> list[tuple[int, int]]:
     """
-    Find all case-insensitive matches of query in text.
+    Find case-insensitive matches of query in text, optionally only the first few.
 
     @param text Text to search in
     @param query Search query
+    @param text_lower Optional precomputed text.lower() (e.g.
+        SessionData.full_content_lower); ignored if its length differs
+    @param limit Stop after this many matches (None for all)
     @returns List of (start, end) tuples for each match
     @complexity O(n*m) where n is text length, m is query length
     @pure true
@@ -431,21 +664,56 @@ def find_search_matches(text: str, query: str) -> list[tuple[int, int]]:
     if not query or not text:
         return []
 
-    matches = []
+    if text_lower is None or len(text_lower) != len(text):
+        text_lower = lower_preserving_positions(text)
+
+    matches: list[tuple[int, int]] = []
     query_lower = query.lower()
-    text_lower = text.lower()
+    query_length = len(query_lower)
     start = 0
 
-    while True:
+    while limit is None or len(matches) < limit:
         pos = text_lower.find(query_lower, start)
         if pos == -1:
             break
-        matches.append((pos, pos + len(query)))
+        matches.append((pos, pos + query_length))
         start = pos + 1
 
     return matches
 
 
+def count_search_matches(text_lower: str, query_lower: str) -> int:
+    """
+    Count (possibly overlapping) occurrences of query_lower in text_lower.
+
+    Matches find_search_matches, which resumes one character after each hit.
+    When the query can't overlap itself (no proper prefix equals a suffix)
+    that count equals str.count, which runs entirely in C.
+
+    @param text_lower Lowercased text to search in
+    @param query_lower Lowercased search query
+    @returns Number of matches
+    @complexity O(n) where n is text length
+    @pure true
+    """
+    if not query_lower:
+        return 0
+
+    can_overlap = any(
+        query_lower.startswith(query_lower[k:]) for k in range(1, len(query_lower))
+    )
+    if not can_overlap:
+        return text_lower.count(query_lower)
+
+    count = 0
+    start = 0
+    find = text_lower.find
+    while (pos := find(query_lower, start)) != -1:
+        count += 1
+        start = pos + 1
+    return count
+
+
 def extract_match_context(text: str, match_start: int, match_end: int, context_chars: int) -> str:
     """
     Extract context around a match with ellipsis if truncated.
@@ -472,7 +740,37 @@ def extract_match_context(text: str, match_start: int, match_end: int, context_c
     return f"{prefix}{context}{suffix}"
 
 
-def format_search_preview(session: "SessionData", query: str) -> str:
+def highlight_match_context(
+    text: str, match_start: int, match_end: int, context_chars: int
+) -> str:
+    """
+    Extract context around a match with the match itself highlighted.
+
+    The exact match span is already known, so it is wrapped in highlight
+    codes directly instead of re-scanning the snippet for fuzzy positions.
+
+    @param text Full text
+    @param match_start Start position of match
+    @param match_end End position of match
+    @param context_chars Characters to show before/after match
+    @returns Context string with ellipses where truncated and match highlighted
+    @complexity O(n) where n is context size
+    @pure true
+    """
+    start = max(0, match_start - context_chars)
+    end = min(len(text), match_end + context_chars)
+
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if end < len(text) else ""
+
+    return (
+        f"{prefix}{text[start:match_start]}"
+        f"{_HIGHLIGHT_START}{text[match_start:match_end]}{COLOR_RESET}"
+        f"{text[match_end:end]}{suffix}"
+    )
+
+
+def format_search_preview(session: SessionData, query: str) -> str:
     """
     Format preview pane with search-aware context showing matching snippets and fuzzy highlighting.
 
@@ -482,11 +780,9 @@ def format_search_preview(session: "SessionData", query: str) -> str:
     @complexity O(n) where n is full_content length
     @pure false - reads terminal size
     """
-    from cc_fi.constants import (
-        MAX_PREVIEW_MATCHES,
-        MATCH_CONTEXT_CHARS,
-    )
-    from cc_fi.models.session import SessionData
+    if not query:
+        # Nothing to search for or highlight
+        return format_fzf_preview(session, "")
 
     try:
         terminal_width = shutil.get_terminal_size().columns
@@ -502,25 +798,27 @@ def format_search_preview(session: "SessionData", query: str) -> str:
     branch_display = highlight_fuzzy_matches(session.git_branch, query) if session.git_branch else ""
 
     # Start with metadata (always shown)
-    lines = [
-        f"{COLOR_BOLD}{COLOR_GREEN}{ICON_PROJECT} Project:{COLOR_RESET}     {COLOR_GREEN}{project_display}{COLOR_RESET}",
-        f"{COLOR_BOLD}{COLOR_BLUE}{ICON_FOLDER} Path:{COLOR_RESET}        {COLOR_BLUE}{path_display}{COLOR_RESET}",
-    ]
+    lines = [_PROJECT_LINE % project_display, _PATH_LINE % path_display]
 
     if session.git_branch:
-        lines.append(f"{COLOR_BOLD}{COLOR_GREEN}{ICON_BRANCH} Branch:{COLOR_RESET}      {COLOR_GREEN}{branch_display}{COLOR_RESET}")
+        lines.append(_BRANCH_LINE % branch_display)
 
     lines.extend([
-        f"{COLOR_BOLD}{COLOR_YELLOW}{ICON_CLOCK} Time:{COLOR_RESET}        {COLOR_YELLOW}{time_str}{COLOR_RESET}",
-        f"{COLOR_BOLD}{COLOR_GRAY}{ICON_SESSION} Session:{COLOR_RESET}     {COLOR_GRAY}{session.session_id}{COLOR_RESET}",
-        f"{COLOR_BOLD}{COLOR_GRAY}{ICON_COMMENT} Messages:{COLOR_RESET}    {COLOR_GRAY}{session.message_count}{COLOR_RESET}",
+        _TIME_LINE % time_str,
+        _SESSION_LINES % (session.session_id, session.message_count),
         "",
         f"{COLOR_OVERLAY0}{'─' * min(60, terminal_width)}{COLOR_RESET}",
         "",
     ])
 
     # Search for matches in full_content
-    matches = find_search_matches(session.full_content, query)
+    # Only the displayed matches need positions; the rest are just counted
+    matches = find_search_matches(
+        session.full_content,
+        query,
+        session.full_content_lower,
+        limit=MAX_PREVIEW_MATCHES,
+    )
 
     if not matches:
         # No deep matches found, show standard messages with fuzzy highlighting
@@ -530,15 +828,20 @@ def format_search_preview(session: "SessionData", query: str) -> str:
         lines.extend([
             f"{COLOR_OVERLAY0}No deep matches found{COLOR_RESET}",
             "",
-            f"{COLOR_BOLD}{COLOR_MAUVE}{ICON_RECENT} Recent Msg:{COLOR_RESET}",
+            _RECENT_HEADING,
             wrap_text_preserve_colors(last_highlighted, terminal_width),
             "",
-            f"{COLOR_BOLD}{COLOR_LAVENDER}{ICON_FIRST} First Msg:{COLOR_RESET}",
+            _FIRST_HEADING,
             wrap_text_preserve_colors(first_highlighted, terminal_width),
         ])
     else:
-        # Show matching snippets with fuzzy highlighting
+        # Show matching snippets with the matched text highlighted
         total_matches = len(matches)
+        if total_matches == MAX_PREVIEW_MATCHES:
+            total_matches = max(
+                total_matches,
+                count_search_matches(session.full_content_lower, query.lower()),
+            )
         display_count = min(MAX_PREVIEW_MATCHES, total_matches)
 
         if total_matches > MAX_PREVIEW_MATCHES:
@@ -548,25 +851,19 @@ def format_search_preview(session: "SessionData", query: str) -> str:
 
         lines.append("")
 
-        # Show first N matches with context and fuzzy highlighting
-        for i, (start, end) in enumerate(matches[:MAX_PREVIEW_MATCHES]):
-            context = extract_match_context(session.full_content, start, end, MATCH_CONTEXT_CHARS)
-
-            # Apply fuzzy highlighting to context
-            context_highlighted = highlight_fuzzy_matches(context, query)
+        # Show first N matches with context and the match highlighted
+        for i, (start, end) in enumerate(matches):
+            context_highlighted = highlight_match_context(
+                session.full_content, start, end, MATCH_CONTEXT_CHARS
+            )
 
             # Wrap context to terminal width
             wrapped = wrap_text_preserve_colors(context_highlighted, terminal_width - 15)
 
-            # Add match number prefix
-            first_line = wrapped.split("\n")[0] if "\n" in wrapped else wrapped
-            remaining_lines = "\n".join(wrapped.split("\n")[1:]) if "\n" in wrapped else ""
-
-            lines.append(f"{COLOR_BOLD}{COLOR_LAVENDER} [Match {i+1}]{COLOR_RESET} {first_line}")
-            if remaining_lines:
-                # Indent continuation lines
-                for line in remaining_lines.split("\n"):
-                    lines.append(f"          {line}")
+            # Add match number prefix, indent continuation lines
+            first_line, *remaining_lines = wrapped.split("\n")
+            lines.append(_MATCH_PREFIX % (i + 1, first_line))
+            lines.extend(_MATCH_INDENT + line for line in remaining_lines)
             lines.append("")
 
         if total_matches > MAX_PREVIEW_MATCHES:
@@ -576,7 +873,7 @@ def format_search_preview(session: "SessionData", query: str) -> str:
     return "\n".join(lines)
 
 
-def format_preview_with_query(session: "SessionData", query: str = "") -> str:
+def format_preview_with_query(session: SessionData, query: str = "") -> str:
     """
     Format preview pane with fuzzy match highlighting, switching between standard and search mode.
 
@@ -586,11 +883,9 @@ def format_preview_with_query(session: "SessionData", query: str = "") -> str:
     @complexity O(n) where n is content size
     @pure false - reads terminal size
     """
-    from cc_fi.models.session import SessionData
-
-    if query and query.strip():
+    query = query.strip() if query else ""
+    if query:
         # Search mode: show matching snippets with fuzzy highlighting
-        return format_search_preview(session, query.strip())
-    else:
-        # Browse mode: show standard preview (no highlighting when no query)
-        return format_fzf_preview(session, "")
+        return format_search_preview(session, query)
+    # Browse mode: show standard preview (no highlighting when no query)
+    return format_fzf_preview(session, "")
@@ -3,12 +3,26 @@
 import shutil
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from cc_fi.constants import FZF_HEIGHT_PERCENT, FZF_PREVIEW_HEIGHT_PERCENT
-from cc_fi.core.formatter import format_fzf_preview, format_list_row
+from cc_fi.core.formatter import (
+    format_fzf_preview,
+    format_header_separator,
+    format_instruction_header,
+    format_list_header,
+    format_list_row,
+    reset_column_width_cache,
+)
+from cc_fi.core.search import build_session_index
 from cc_fi.models.session import SessionData
 
+# Pushes the searchable copy of each row far off-screen; the --no-hscroll
+# flag prevents fzf from scrolling to show it. 200 spaces is beyond typical
+# terminal width.
+_SEARCH_PADDING = " " * 200
+
 
 def check_fzf_installed() -> bool:
     """
@@ -39,44 +53,42 @@ def build_fzf_input(sessions: list[SessionData]) -> str:
     @complexity O(n) where n is number of sessions
     @pure true
     """
-    import re
-    from cc_fi.core.formatter import (
-        format_header_separator,
-        format_instruction_header,
-        format_list_header,
-    )
+    return "\n".join(iter_fzf_rows(sessions))
+
+
+def iter_fzf_rows(sessions: list[SessionData]) -> Iterator[str]:
+    """
+    Yield fzf input rows (see build_fzf_input) one at a time.
 
+    Lets run_fzf_selection stream rows into fzf's stdin as they are
+    formatted instead of holding the whole input as one string.
+
+    @param sessions List of sessions to display
+    @returns Iterator of rows without trailing newlines, header rows first
+    @complexity O(n) where n is number of sessions
+    @pure false - reads terminal size
+    """
+    reset_column_width_cache()
     instruction_header = format_instruction_header()
     instruction_lines = instruction_header.split("\n")
 
-    rows = [
-        f"INSTRUCTION1|{instruction_lines[0]}",
-        f"INSTRUCTION2|{instruction_lines[1]}",
-        f"HEADER|{format_list_header()}",
-        f"SEPARATOR|{format_header_separator()}",
-    ]
+    yield f"INSTRUCTION1|{instruction_lines[0]}"
+    yield f"INSTRUCTION2|{instruction_lines[1]}"
+    yield f"HEADER|{format_list_header()}"
+    yield f"SEPARATOR|{format_header_separator()}"
 
     for session in sessions:
         formatted = format_list_row(session)
 
-        # Get searchable content - combine formatted plain text + conversation content
-        formatted_plain = re.sub(r'\x1b\[[0-9;]*m', '', formatted)
+        # fzf --ansi already matches the displayed row's text with color codes
+        # removed, so only the conversation snippet needs a hidden copy
         content_snippet = session.full_content[:500].replace("\n", " ").replace("\r", " ").replace("|", " ")
-        searchable = f"{formatted_plain} {content_snippet}"
-
-        # Position searchable content far off-screen using spaces
-        # The --no-hscroll flag prevents fzf from scrolling to show it
-        # Using 200 spaces to ensure content is beyond typical terminal width
-        spacing = " " * 200
-
-        # Build the display string with searchable content positioned off-screen
-        display_with_search = f"{formatted}{spacing}{searchable}"
 
-        # Two-column format: session_id|display_with_search
-        row = f"{session.session_id}|{display_with_search}"
-        rows.append(row)
-
-    return "\n".join(rows)
+        # Two-column format: session_id|display_with_search, with the
+        # searchable content positioned off-screen after the display row
+        yield (
+            f"{session.session_id}|{formatted}{_SEARCH_PADDING}{content_snippet}"
+        )
 
 
 def extract_session_id_from_line(line: str) -> str:
@@ -109,13 +121,13 @@ def run_fzf_selection(sessions: list[SessionData]) -> SessionData | None:
             "or apt install fzf (Linux)"
         )
 
-    fzf_input = build_fzf_input(sessions)
-    session_map = {s.session_id: s for s in sessions}
+    session_map = build_session_index(sessions)
 
-    # Build preview command that extracts session ID and passes search query
-    # {q} is the current fzf query, {} is the selected line
-    # Session ID is in the first column of pipe-delimited format
-    preview_cmd = "echo {} | cut -d'|' -f1 | xargs -I % sh -c 'cc-fi --preview % --preview-query \"{q}\"' 2>/dev/null"
+    # Build preview command that passes session ID and search query
+    # {1} is the first pipe-delimited field (session ID) of the selected line
+    # and {q} is the current fzf query; fzf shell-quotes both, so no
+    # echo | cut | xargs pipeline has to be forked on every keystroke
+    preview_cmd = "cc-fi --preview {1} --preview-query {q} 2>/dev/null"
 
     cmd = [
         "fzf",
@@ -134,18 +146,31 @@ def run_fzf_selection(sessions: list[SessionData]) -> SessionData | None:
     ]
 
     try:
-        result = subprocess.run(
+        # Stream rows as they are formatted so fzf can start drawing early.
+        # The pipe is binary: each row is encoded once as it is written, and
+        # only the single selected line is decoded back
+        process = subprocess.Popen(
             cmd,
-            input=fzf_input,
-            text=True,
-            capture_output=True,
-            check=False,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-
-        if result.returncode != 0:
+        assert process.stdin is not None  # stdin=PIPE always creates it
+        try:
+            write = process.stdin.write
+            for row in iter_fzf_rows(sessions):
+                # "replace" keeps a lone surrogate in a transcript from
+                # aborting the whole listing
+                write(f"{row}\n".encode("utf-8", "replace"))
+        except BrokenPipeError:
+            # fzf exited (selection or Esc) before reading every row
+            pass
+        stdout, _ = process.communicate()
+
+        if process.returncode != 0:
             return None
 
-        selected_line = result.stdout.strip()
+        selected_line = stdout.decode("utf-8", "replace").strip()
         session_id = extract_session_id_from_line(selected_line)
         return session_map.get(session_id)
 
@@ -1,11 +1,17 @@
 """Session discovery and indexing."""
 
 import logging
+import operator
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 from cc_fi.constants import (
     AGENT_FILE_PREFIX,
     CLAUDE_PROJECTS_DIR,
+    PARALLEL_PARSE_MIN_FILES,
     SESSION_FILE_EXTENSION,
 )
 from cc_fi.models.session import SessionData
@@ -59,42 +65,139 @@ def find_session_files(projects_dir: Path) -> list[Path]:
             "Ensure Claude Code is installed and has been run at least once."
         )
 
+    # Walk with os.scandir instead of rglob + is_session_file: DirEntry
+    # answers is_file/is_dir from the d_type readdir already returned, so
+    # most entries cost no stat call at all
     session_files = []
-    for file_path in projects_dir.rglob(f"*{SESSION_FILE_EXTENSION}"):
-        if is_session_file(file_path):
-            session_files.append(file_path)
+    pending = [os.fspath(projects_dir)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Unreadable subdirectory; rglob skipped these silently too
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.endswith(SESSION_FILE_EXTENSION)
+                    and name != SESSION_FILE_EXTENSION
+                    and not name.startswith(AGENT_FILE_PREFIX)
+                    and entry.is_file()
+                ):
+                    session_files.append(Path(entry.path))
+                elif entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
 
     return session_files
 
 
-def index_sessions(force_rebuild: bool = False) -> list[SessionData]:
+def _parse_session_file(file_path: Path) -> tuple[SessionData | None, str | None]:
+    """
+    Parse one session file, returning the error instead of raising.
+
+    Module-level so it can run in a worker process; failures are reported
+    back as text and logged by the parent.
+
+    @param file_path Path to .jsonl session file
+    @returns (session, None) on success, (None, error message) on failure
+    @complexity O(m) where m is lines in file
+    @pure false - reads filesystem
+    """
+    try:
+        return SessionData.from_jsonl_file(file_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def parse_session_files(file_paths: list[Path]) -> list[SessionData]:
+    """
+    Parse session files, across worker processes when there are many.
+
+    Parsing is CPU-bound and independent per file, so full rebuilds spread
+    it over all cores. Small batches (the usual incremental re-index) stay
+    serial to avoid process start-up cost, as do single-core machines.
+
+    @param file_paths Session files to parse
+    @returns Successfully parsed sessions, in file_paths order
+    @complexity O(n*m) where n=files, m=avg lines per file
+    @pure false - reads filesystem, may start worker processes
+    """
+    workers = min(os.cpu_count() or 1, len(file_paths))
+    results: Iterable[tuple[SessionData | None, str | None]] | None = None
+
+    if len(file_paths) >= PARALLEL_PARSE_MIN_FILES and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(_parse_session_file, file_paths, chunksize=8)
+                )
+        except (OSError, BrokenProcessPool) as e:
+            logger.debug(f"Parallel parse unavailable, parsing serially: {e}")
+
+    if results is None:
+        results = map(_parse_session_file, file_paths)
+
+    sessions = []
+    for file_path, (session, error) in zip(file_paths, results, strict=True):
+        if session is None:
+            logger.warning(f"Failed to parse {file_path}: {error}")
+            continue
+        sessions.append(session)
+
+    return sessions
+
+
+def index_sessions(
+    force_rebuild: bool = False,
+    previous: dict[str, SessionData] | None = None,
+) -> list[SessionData]:
     """
     Index all Claude Code sessions.
 
-    @param force_rebuild If True, skip cache and rebuild index
+    Files whose current mtime equals the last_modified of their entry in
+    previous are reused as-is; everything else is parsed.
+
+    @param force_rebuild If True, ignore previous and re-parse every file
+    @param previous Previously indexed sessions keyed by str(file_path)
     @returns List of SessionData objects sorted by last modified
     @throws FileNotFoundError When Claude directory doesn't exist
-    @complexity O(n*m) where n=files, m=avg lines per file
+    @complexity O(n*m) where n=changed files, m=avg lines per file
     @pure false - reads filesystem
     """
     import time
 
     start_time = time.perf_counter()
 
+    if force_rebuild or previous is None:
+        previous = {}
+
     session_files = find_session_files(CLAUDE_PROJECTS_DIR)
     sessions = []
+    to_parse = []
+    reused_count = 0
 
     for file_path in session_files:
-        try:
-            session = SessionData.from_jsonl_file(file_path)
-            sessions.append(session)
-        except Exception as e:
-            logger.warning(f"Failed to parse {file_path}: {e}")
-            continue
-
-    sessions.sort(key=lambda s: s.last_modified, reverse=True)
+        cached = previous.get(str(file_path))
+        if cached is not None:
+            try:
+                unchanged = file_path.stat().st_mtime == cached.last_modified
+            except OSError:
+                continue
+            if unchanged:
+                sessions.append(cached)
+                reused_count += 1
+                continue
+
+        to_parse.append(file_path)
+
+    sessions.extend(parse_session_files(to_parse))
+    sessions.sort(key=operator.attrgetter("last_modified"), reverse=True)
 
     elapsed = time.perf_counter() - start_time
-    logger.info(f"Indexed {len(sessions)} sessions in {elapsed:.2f}s")
+    logger.info(
+        f"Indexed {len(sessions)} sessions ({reused_count} unchanged) "
+        f"in {elapsed:.2f}s"
+    )
 
     return sessions
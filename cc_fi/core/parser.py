@@ -1,8 +1,40 @@
 """Parse Claude Code session JSONL files."""
 
 import json
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, stdlib json works too
+    orjson = None
+
+
+def _loads_line(line: bytes) -> Any:
+    """
+    Decode one JSONL line, preferring orjson when it is installed.
+
+    Lines are read as bytes so orjson can parse them without a separate
+    UTF-8 decode. orjson.JSONDecodeError subclasses json.JSONDecodeError,
+    so callers catch one exception type either way.
+
+    @param line Raw UTF-8 encoded JSON line
+    @returns Decoded JSON value
+    @throws json.JSONDecodeError When line is malformed
+    @complexity O(n) where n is line length
+    @pure true
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson rejects escaped lone surrogates; stdlib json accepts them
+            pass
+    return json.loads(line.decode("utf-8"))
 
 
 def extract_project_name(cwd: str) -> str:
@@ -11,10 +43,15 @@ def extract_project_name(cwd: str) -> str:
 
     @param cwd Working directory path
     @returns Last component of path (project name)
-    @complexity O(1)
+    @complexity O(n) where n is path length
     @pure true
     """
-    return Path(cwd).name
+    # Plain string ops instead of building a Path per session; only a
+    # trailing "." component needs Path's normalization
+    name = cwd.rstrip("/").rpartition("/")[2]
+    if name == ".":
+        return Path(cwd).name
+    return name
 
 
 def extract_session_id_from_filename(file_path: Path) -> str:
@@ -143,6 +180,170 @@ def is_tool_result_message(data: dict) -> bool:
     )
 
 
+def _split_jsonl(data: bytes) -> list[bytes]:
+    """
+    Split raw session bytes into JSONL lines.
+
+    Splits on b"\n" only, like iterating the file in binary mode, so the
+    lines are the same ones the file-based readers below see.
+
+    @param data Raw file contents
+    @returns Lines without their newline; no trailing empty entry
+    @complexity O(n) where n is len(data)
+    @pure true
+    """
+    lines = data.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _count_lines(data: bytes, lines: list[bytes]) -> int:
+    """
+    Count lines the way text-mode (universal newline) iteration would.
+
+    @param data Raw file contents
+    @param lines _split_jsonl(data), reused as the count when data has no \r
+    @returns Number of lines, counting \n, \r and \r\n as one break each
+    @complexity O(n) where n is len(data)
+    @pure true
+    """
+    if b"\r" not in data:
+        return len(lines)
+
+    breaks = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+    if data and not data.endswith((b"\n", b"\r")):
+        breaks += 1
+    return breaks
+
+
+def _iter_user_data(lines: Iterable[bytes]) -> Iterator[dict]:
+    """
+    Decode the user entries among JSONL lines, skipping everything else.
+
+    Lines without the bytes "user" can't be user entries, so they are never
+    JSON-decoded; in real sessions these are the assistant lines, which hold
+    most of the file's bytes. Blank and malformed lines are skipped.
+
+    @param lines Raw JSONL lines
+    @returns Iterator of decoded entries whose type is "user"
+    @complexity O(n) where n is total line length
+    @pure true
+    """
+    for line in lines:
+        if b'"user"' not in line:
+            continue
+
+        try:
+            data = _loads_line(line)
+        except json.JSONDecodeError:
+            continue
+
+        if isinstance(data, dict) and data.get("type") == "user":
+            yield data
+
+
+def _all_user_messages(lines: Iterable[bytes]) -> str:
+    """
+    Join every real user message among JSONL lines (see extract_all_user_messages).
+
+    @param lines Raw JSONL lines
+    @returns All user messages joined with " | " separator (single line)
+    @complexity O(n) where n is total line length
+    @pure true
+    """
+    messages = []
+
+    for data in _iter_user_data(lines):
+        # Skip tool results
+        if is_tool_result_message(data):
+            continue
+
+        # Extract text content
+        message = data.get("message", {})
+        content = message.get("content", "")
+        text = extract_text_from_content(content)
+
+        # Skip boilerplate
+        if is_boilerplate_message(text):
+            continue
+
+        # Skip empty messages
+        if not text.strip():
+            continue
+
+        # Replace newlines with spaces for single-line fzf display
+        text_single_line = " ".join(text.split())
+        messages.append(text_single_line)
+
+    return " | ".join(messages)
+
+
+def _first_user_message(lines: Iterable[bytes]) -> tuple[dict, str] | None:
+    """
+    Find the first real user message among JSONL lines.
+
+    @param lines Raw JSONL lines; consumed only up to the message found
+    @returns (first_user_data, message_content), falling back to the first
+        boilerplate message, or None when there are no user messages
+    @complexity O(n) worst case - stops at first real user message
+    @pure true
+    """
+    first_found = None
+
+    for data in _iter_user_data(lines):
+        # Skip tool result messages
+        if is_tool_result_message(data):
+            continue
+
+        message = data.get("message", {})
+        content = message.get("content", "")
+        text = extract_text_from_content(content)
+
+        # Save first user message as fallback
+        if first_found is None:
+            first_found = (data, text)
+
+        # Skip boilerplate messages, keep looking
+        if is_boilerplate_message(text):
+            continue
+
+        # Found a real user message
+        return data, text
+
+    # First message found, even if it's boilerplate
+    return first_found
+
+
+def _last_user_message(lines: list[bytes], max_lines: int) -> str:
+    """
+    Find the last real user message within the final max_lines JSONL lines.
+
+    @param lines Raw JSONL lines
+    @param max_lines Maximum lines to search from end
+    @returns Last user message content (empty if only tool results/boilerplate found)
+    @complexity O(n) where n is max_lines
+    @pure true
+    """
+    tail_lines = lines[-max_lines:] if len(lines) > max_lines else lines
+
+    for data in _iter_user_data(reversed(tail_lines)):
+        # Skip tool result messages
+        if is_tool_result_message(data):
+            continue
+
+        content = data.get("message", {}).get("content", "")
+        text = extract_text_from_content(content)
+
+        # Skip boilerplate messages
+        if is_boilerplate_message(text):
+            continue
+
+        return text
+
+    return ""
+
+
 def extract_all_user_messages(file_path: Path) -> str:
     """
     Extract all user messages from session for deep search.
@@ -160,49 +361,12 @@ def extract_all_user_messages(file_path: Path) -> str:
     @complexity O(n) where n is lines in session file
     @pure false - reads filesystem
     """
-    messages = []
-
     try:
-        with file_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                # Only process user messages
-                if data.get("type") != "user":
-                    continue
-
-                # Skip tool results
-                if is_tool_result_message(data):
-                    continue
-
-                # Extract text content
-                message = data.get("message", {})
-                content = message.get("content", "")
-                text = extract_text_from_content(content)
-
-                # Skip boilerplate
-                if is_boilerplate_message(text):
-                    continue
-
-                # Skip empty messages
-                if not text.strip():
-                    continue
-
-                # Replace newlines with spaces for single-line fzf display
-                text_single_line = " ".join(text.split())
-                messages.append(text_single_line)
-
+        with file_path.open("rb") as f:
+            return _all_user_messages(f)
     except (FileNotFoundError, PermissionError):
         return ""
 
-    return " | ".join(messages)
-
 
 def parse_first_user_message(file_path: Path) -> tuple[dict, str]:
     """
@@ -211,48 +375,16 @@ def parse_first_user_message(file_path: Path) -> tuple[dict, str]:
     @param file_path Path to session file
     @returns Tuple of (first_user_data, message_content)
     @throws FileNotFoundError When file doesn't exist
-    @throws json.JSONDecodeError When malformed JSON
     @throws ValueError When no user messages found
     @complexity O(n) worst case - reads until first user message
     @pure false - reads filesystem
     """
-    first_found = None
-
-    with file_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if not line.strip():
-                continue
-
-            try:
-                data = json.loads(line)
-                if data.get("type") == "user":
-                    # Skip tool result messages
-                    if is_tool_result_message(data):
-                        continue
+    with file_path.open("rb") as f:
+        first_found = _first_user_message(f)
 
-                    message = data.get("message", {})
-                    content = message.get("content", "")
-                    text = extract_text_from_content(content)
-
-                    # Save first user message as fallback
-                    if first_found is None:
-                        first_found = (data, text)
-
-                    # Skip boilerplate messages, keep looking
-                    if is_boilerplate_message(text):
-                        continue
-
-                    # Found a real user message
-                    return data, text
-
-            except json.JSONDecodeError:
-                continue
-
-    # Return first message found, even if it's boilerplate
-    if first_found:
-        return first_found
-
-    raise ValueError(f"No user messages found in: {file_path}")
+    if first_found is None:
+        raise ValueError(f"No user messages found in: {file_path}")
+    return first_found
 
 
 def parse_last_user_message(file_path: Path, max_lines: int) -> str:
@@ -265,33 +397,7 @@ def parse_last_user_message(file_path: Path, max_lines: int) -> str:
     @complexity O(n) where n is max_lines
     @pure false - reads filesystem
     """
-    from cc_fi.constants import MAX_TAIL_LINES_FOR_LAST_MSG
-
-    with file_path.open("r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    tail_lines = lines[-max_lines:] if len(lines) > max_lines else lines
-
-    for line in reversed(tail_lines):
-        try:
-            data = json.loads(line)
-            if data.get("type") == "user":
-                # Skip tool result messages
-                if is_tool_result_message(data):
-                    continue
-
-                content = data.get("message", {}).get("content", "")
-                text = extract_text_from_content(content)
-
-                # Skip boilerplate messages
-                if is_boilerplate_message(text):
-                    continue
-
-                return text
-        except json.JSONDecodeError:
-            continue
-
-    return ""
+    return _last_user_message(_split_jsonl(file_path.read_bytes()), max_lines)
 
 
 def count_messages(file_path: Path) -> int:
@@ -300,11 +406,11 @@ def count_messages(file_path: Path) -> int:
 
     @param file_path Path to session file
     @returns Number of lines (messages) in file
-    @complexity O(1) - uses wc-like approach
+    @complexity O(n) where n is file size
     @pure false - reads filesystem
     """
-    with file_path.open("r", encoding="utf-8") as f:
-        return sum(1 for _ in f)
+    data = file_path.read_bytes()
+    return _count_lines(data, _split_jsonl(data))
 
 
 def extract_metadata_from_file(file_path: Path) -> "SessionData":
@@ -323,7 +429,18 @@ def extract_metadata_from_file(file_path: Path) -> "SessionData":
     from cc_fi.constants import MAX_TAIL_LINES_FOR_LAST_MSG
     from cc_fi.models.session import SessionData
 
-    first_data, first_msg = parse_first_user_message(file_path)
+    # Stat before reading: if the file is appended to while we parse, the
+    # recorded mtime is older than the file's and the next index re-parses it
+    last_modified = file_path.stat().st_mtime
+
+    # Read the file once; every field below comes from the same lines
+    data = file_path.read_bytes()
+    lines = _split_jsonl(data)
+
+    first_found = _first_user_message(lines)
+    if first_found is None:
+        raise ValueError(f"No user messages found in: {file_path}")
+    first_data, first_msg = first_found
 
     # Extract session ID from filename (not content) since Claude Code uses filename for resuming
     session_id = extract_session_id_from_filename(file_path)
@@ -337,12 +454,11 @@ def extract_metadata_from_file(file_path: Path) -> "SessionData":
     timestamp_str = first_data["timestamp"]
     timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
 
-    last_msg = parse_last_user_message(file_path, MAX_TAIL_LINES_FOR_LAST_MSG)
-    msg_count = count_messages(file_path)
-    last_modified = file_path.stat().st_mtime
+    last_msg = _last_user_message(lines, MAX_TAIL_LINES_FOR_LAST_MSG)
+    msg_count = _count_lines(data, lines)
 
     # Extract all user messages for deep search
-    full_content = extract_all_user_messages(file_path)
+    full_content = _all_user_messages(lines)
 
     # Create both truncated (for table) and full (for preview) versions
     from cc_fi.constants import MESSAGE_PREVIEW_LENGTH, MESSAGE_DETAIL_LENGTH
@@ -20,21 +20,11 @@ def matches_search_term(session: SessionData, search_term: str) -> bool:
     """
     search_lower = search_term.lower()
 
-    fields_to_search = [
-        session.session_id,
-        session.cwd,
-        session.project_name,
-        session.git_branch,
-        session.first_message,
-        session.last_message,
-        session.full_content,  # Deep search across all user messages
-    ]
-
-    for field in fields_to_search:
-        if search_lower in field.lower():
-            return True
-
-    return False
+    # Metadata and deep content are each lowercased once per session
+    return (
+        search_lower in session.metadata_lower
+        or search_lower in session.full_content_lower
+    )
 
 
 def filter_sessions(
@@ -73,6 +63,21 @@ def get_session_by_id(
     return None
 
 
+def build_session_index(sessions: list[SessionData]) -> dict[str, SessionData]:
+    """
+    Map session IDs to sessions for repeated O(1) lookups.
+
+    Worth it when looking up many IDs against the same list; for a single
+    lookup get_session_by_id is cheaper since it stops at the first hit.
+
+    @param sessions List of sessions (IDs assumed unique, as after dedup)
+    @returns Dict of session_id to SessionData
+    @complexity O(n) where n is number of sessions
+    @pure true
+    """
+    return {session.session_id: session for session in sessions}
+
+
 def get_unique_projects(sessions: list[SessionData]) -> set[str]:
     """
     Extract unique project names from sessions.
@@ -4,9 +4,13 @@ import argparse
 import logging
 import sys
 
-from cc_fi.core.cache import get_sessions_with_cache, invalidate_cache
+from cc_fi.core.cache import (
+    get_session_with_cache,
+    get_sessions_with_cache,
+    invalidate_cache,
+)
 from cc_fi.core.formatter import format_list_header, format_list_row, format_fzf_preview
-from cc_fi.core.search import filter_sessions, get_session_by_id
+from cc_fi.core.search import filter_sessions
 
 
 def setup_logging(verbose: bool) -> None:
@@ -24,6 +28,30 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
+def write_lines(lines: list[str]) -> None:
+    """
+    Write lines to stdout as a single encoded block.
+
+    Encodes once and writes the bytes straight to the underlying buffer,
+    instead of paying print()'s per-call overhead and per-line encode.
+
+    @param lines Lines to write (without trailing newlines)
+    @complexity O(n) where n is total output length
+    @pure false - writes to stdout
+    """
+    output = "\n".join(lines) + "\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(output)
+        return
+
+    encoding = sys.stdout.encoding or "utf-8"
+    errors = sys.stdout.errors or "strict"
+    sys.stdout.flush()
+    buffer.write(output.encode(encoding, errors))
+    buffer.flush()
+
+
 def print_sessions_list(sessions: list, show_header: bool = True) -> None:
     """
     Print sessions in columnar format.
@@ -33,14 +61,16 @@ def print_sessions_list(sessions: list, show_header: bool = True) -> None:
     @complexity O(n) where n is number of sessions
     @pure false - writes to stdout
     """
-    from cc_fi.core.formatter import format_header_separator
+    from cc_fi.core.formatter import format_header_separator, reset_column_width_cache
 
+    reset_column_width_cache()
+    lines = []
     if show_header:
-        print(format_list_header())
-        print(format_header_separator())
+        lines.append(format_list_header())
+        lines.append(format_header_separator())
 
-    for session in sessions:
-        print(format_list_row(session))
+    lines.extend(format_list_row(session) for session in sessions)
+    write_lines(lines)
 
 
 def handle_preview_mode(session_id: str, query: str = "") -> None:
@@ -49,7 +79,7 @@ def handle_preview_mode(session_id: str, query: str = "") -> None:
 
     @param session_id Session ID to preview
     @param query Optional search query from fzf
-    @complexity O(n) where n is cached sessions
+    @complexity O(k) where k is the session's cache entry size (valid cache)
     @pure false - reads cache, writes to stdout
     """
     import logging
@@ -57,11 +87,10 @@ def handle_preview_mode(session_id: str, query: str = "") -> None:
 
     logging.disable(logging.CRITICAL)
 
-    sessions = get_sessions_with_cache()
-    session = get_session_by_id(sessions, session_id)
+    session = get_session_with_cache(session_id)
 
     if session:
-        print(format_preview_with_query(session, query))
+        write_lines([format_preview_with_query(session, query)])
     else:
         print(f"Session not found: {session_id}")
 
@@ -234,7 +263,10 @@ def handle_list_mode(search_term: str, force_rebuild: bool) -> None:
     @complexity O(n) where n is number of sessions
     @pure false - reads cache/filesystem
     """
-    sessions = get_sessions_with_cache(force_rebuild=force_rebuild)
+    # Unfiltered listings never read full_content
+    sessions = get_sessions_with_cache(
+        force_rebuild=force_rebuild, with_content=bool(search_term)
+    )
 
     if search_term:
         sessions = filter_sessions(sessions, search_term)
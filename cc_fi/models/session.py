@@ -1,16 +1,25 @@
 """Session data model and factory methods."""
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionData:
     """
     Represents a Claude Code session with metadata.
 
+    Slotted, so instances carry no per-object __dict__. The derived values
+    below are memoized in private slots rather than with cached_property,
+    which needs that __dict__.
+
+    The memo slots are filled on first read and never invalidated, so fields
+    must not be reassigned once content_fingerprint, has_content,
+    full_content_lower or metadata_lower has been read; build a new instance
+    (dataclasses.replace) instead.
+
     @description Immutable data container for session information
     @complexity O(1) for all field access
     @pure true - dataclass is immutable
@@ -30,6 +39,21 @@ class SessionData:
     last_message_full: str = ""  # Longer text (400 chars) for table and preview display
     full_content: str = ""  # All user messages for deep search
 
+    # Memoized derived values (None until first access, never reset); not
+    # part of the constructor, repr or equality
+    _content_fingerprint: tuple[str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _has_content: bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _full_content_lower: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _metadata_lower: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def content_fingerprint(self) -> tuple[str, str, str]:
         """
@@ -37,14 +61,84 @@ class SessionData:
 
         Fingerprint is based on timestamp, first message, and working directory
         to identify sessions with identical content but different session IDs.
+        Computed once per instance; later accesses return the same tuple, whose
+        strings keep their cached hashes.
 
         @returns Tuple of (timestamp_iso, first_message_prefix, cwd)
         @complexity O(1)
         @pure true
         """
-        timestamp_iso = self.timestamp.isoformat()
-        message_prefix = self.first_message[:100]
-        return (timestamp_iso, message_prefix, self.cwd)
+        fingerprint = self._content_fingerprint
+        if fingerprint is None:
+            timestamp_iso = self.timestamp.isoformat()
+            message_prefix = self.first_message[:100]
+            fingerprint = self._content_fingerprint = (
+                timestamp_iso,
+                message_prefix,
+                self.cwd,
+            )
+        return fingerprint
+
+    @property
+    def has_content(self) -> bool:
+        """
+        Check if session has any meaningful content (computed once).
+
+        @returns True if session has user messages, False otherwise
+        @complexity O(1)
+        @pure true
+        """
+        result = self._has_content
+        if result is None:
+            result = self._has_content = bool(
+                self.first_message.strip() or self.last_message.strip()
+            )
+        return result
+
+    @property
+    def full_content_lower(self) -> str:
+        """
+        Lowercased full_content for case-insensitive search (computed once).
+
+        Not serialized: storing it would double the cache that every preview
+        process has to load.
+
+        @returns full_content.lower()
+        @complexity O(n) on first access, O(1) after
+        @pure true
+        """
+        lowered = self._full_content_lower
+        if lowered is None:
+            lowered = self._full_content_lower = self.full_content.lower()
+        return lowered
+
+    @property
+    def metadata_lower(self) -> str:
+        """
+        Lowercased searchable metadata fields joined into one string (computed once).
+
+        Fields are NUL-separated so a search term can't match across the
+        boundary between two fields. full_content is left out; it has its
+        own full_content_lower and would double this string's size.
+
+        @returns Lowercased session_id, cwd, project_name, git_branch,
+            first_message and last_message
+        @complexity O(n) on first access where n is total field length, O(1) after
+        @pure true
+        """
+        lowered = self._metadata_lower
+        if lowered is None:
+            lowered = self._metadata_lower = "\0".join(
+                (
+                    self.session_id,
+                    self.cwd,
+                    self.project_name,
+                    self.git_branch,
+                    self.first_message,
+                    self.last_message,
+                )
+            ).lower()
+        return lowered
 
     @classmethod
     def from_jsonl_file(cls, file_path: Path) -> "SessionData":
@@ -0,0 +1,247 @@
+"""Unit tests for cache module."""
+
+from datetime import datetime
+from pathlib import Path
+
+from cc_fi.core.cache import load_cache, save_cache, save_cache_in_background
+from cc_fi.models.session import SessionData
+
+
+def create_test_session(session_id: str, last_modified: float = 1000.0) -> SessionData:
+    """Helper to create test SessionData."""
+    return SessionData(
+        session_id=session_id,
+        cwd="/Users/test/project",
+        project_name="project",
+        git_branch="main",
+        timestamp=datetime(2025, 11, 5, 22, 53, 41),
+        first_message="First message",
+        last_message="Last message",
+        message_count=10,
+        file_path=Path("/tmp/test.jsonl"),
+        last_modified=last_modified,
+        first_message_full="First message full",
+        last_message_full="Last message full",
+        full_content="First message | Last message with ünïcödé",
+    )
+
+
+def test_save_and_load_cache_roundtrip(tmp_path):
+    """Test that sessions survive a save/load roundtrip unchanged."""
+    cache_path = tmp_path / "cache.json"
+    sessions = [create_test_session("abc"), create_test_session("def", 2000.0)]
+
+    save_cache(sessions, cache_path)
+    loaded = load_cache(cache_path)
+
+    assert loaded == sessions
+
+
+def test_save_cache_creates_parent_directory(tmp_path):
+    """Test that save_cache creates missing parent directories."""
+    cache_path = tmp_path / "nested" / "dir" / "cache.json"
+
+    save_cache([create_test_session("abc")], cache_path)
+
+    assert cache_path.exists()
+
+
+def test_load_cache_large_file_roundtrip(tmp_path, monkeypatch):
+    """Test that caches above the mmap threshold load identically."""
+    import cc_fi.core.cache as cache
+
+    monkeypatch.setattr(cache, "CACHE_MMAP_THRESHOLD_BYTES", 1)
+    cache_path = tmp_path / "cache.json"
+    sessions = [create_test_session(f"session-{i}") for i in range(50)]
+
+    save_cache(sessions, cache_path)
+
+    assert load_cache(cache_path) == sessions
+
+
+def test_save_cache_leaves_no_temp_files(tmp_path):
+    """Test that atomic save renames its temp file over the cache."""
+    cache_path = tmp_path / "cache.json"
+
+    save_cache([create_test_session("abc")], cache_path)
+    save_cache([create_test_session("def")], cache_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "cache.json",
+        "cache.json.idx",
+        "cache.json.meta",
+    ]
+    assert load_cache(cache_path)[0].session_id == "def"
+
+
+def test_save_cache_in_background_writes_cache(tmp_path):
+    """Test that background save produces a loadable cache once joined."""
+    cache_path = tmp_path / "cache.json"
+    sessions = [create_test_session("abc")]
+
+    save_cache_in_background(sessions, cache_path).join()
+
+    assert load_cache(cache_path) == sessions
+
+
+def test_iter_cache_streams_sessions(tmp_path):
+    """Test that iter_cache yields the same sessions load_cache returns."""
+    from cc_fi.core.cache import iter_cache
+
+    cache_path = tmp_path / "cache.json"
+    sessions = [create_test_session("abc"), create_test_session("def")]
+    save_cache(sessions, cache_path)
+
+    iterator = iter_cache(cache_path)
+
+    assert next(iterator) == sessions[0]
+    assert list(iterator) == sessions[1:]
+
+
+def test_is_cache_valid_sees_own_writes_and_invalidation(tmp_path):
+    """Test that memoized stat results don't hide saves or invalidation."""
+    from cc_fi.core.cache import invalidate_cache, is_cache_valid
+
+    cache_path = tmp_path / "cache.json"
+
+    assert not is_cache_valid(cache_path, 30)
+    save_cache([create_test_session("abc")], cache_path)
+    assert is_cache_valid(cache_path, 30)
+    invalidate_cache(cache_path)
+    assert not is_cache_valid(cache_path, 30)
+
+
+def test_save_cache_is_compact(tmp_path):
+    """Test that the cache is written without pretty-printing whitespace."""
+    cache_path = tmp_path / "cache.json"
+
+    save_cache([create_test_session("abc")], cache_path)
+
+    raw = cache_path.read_bytes()
+    assert b"\n" not in raw
+    assert b'": ' not in raw
+
+
+def test_save_cache_handles_lone_surrogates(tmp_path):
+    """Test that text with lone surrogates still roundtrips."""
+    cache_path = tmp_path / "cache.json"
+    session = create_test_session("abc")
+    session.full_content = "broken \ud800 surrogate"
+
+    save_cache([session], cache_path)
+
+    assert load_cache(cache_path)[0].full_content == session.full_content
+
+
+def test_invalidate_cache_missing_file_is_noop(tmp_path):
+    """Test that invalidating a nonexistent cache does not raise."""
+    from cc_fi.core.cache import invalidate_cache
+
+    invalidate_cache(tmp_path / "missing.json")
+
+
+def test_load_indexed_sessions_includes_excluded(tmp_path):
+    """Test that sessions dropped from the result are kept for re-indexing."""
+    from cc_fi.core.cache import load_indexed_sessions
+
+    cache_path = tmp_path / "cache.json"
+    kept = create_test_session("abc")
+    dropped = create_test_session("def")
+    dropped.file_path = Path("/tmp/other.jsonl")
+
+    save_cache([kept], cache_path, excluded=[dropped])
+
+    assert load_cache(cache_path) == [kept]
+    assert load_indexed_sessions(cache_path) == {
+        "/tmp/test.jsonl": kept,
+        "/tmp/other.jsonl": dropped,
+    }
+
+
+def test_load_indexed_sessions_missing_cache(tmp_path):
+    """Test that a missing cache yields nothing to reuse."""
+    from cc_fi.core.cache import load_indexed_sessions
+
+    assert load_indexed_sessions(tmp_path / "missing.json") == {}
+
+
+def test_load_indexed_sessions_rejects_non_object_cache(tmp_path):
+    """Test that a cache file holding a JSON array is treated as unusable."""
+    from cc_fi.core.cache import load_indexed_sessions
+
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text('["not", "a", "cache"]')
+
+    assert load_indexed_sessions(cache_path) == {}
+
+
+def test_load_cached_session_reads_single_entry(tmp_path):
+    """Test that one session loads via the offset index."""
+    from cc_fi.core.cache import load_cached_session
+
+    cache_path = tmp_path / "cache.json"
+    sessions = [create_test_session("abc"), create_test_session("def", 2000.0)]
+    sessions[1].full_content = "broken \ud800 surrogate"
+    save_cache(sessions, cache_path, excluded=[create_test_session("old")])
+
+    assert load_cached_session("def", cache_path) == sessions[1]
+    assert load_cached_session("abc", cache_path) == sessions[0]
+    assert load_cached_session("old", cache_path) is None
+    assert load_cache(cache_path) == sessions
+
+
+def test_load_cached_session_rejects_stale_index(tmp_path):
+    """Test that an index not matching the cache is not trusted."""
+    from cc_fi.core.cache import load_cached_session
+
+    cache_path = tmp_path / "cache.json"
+    save_cache([create_test_session("abc")], cache_path)
+    stale_index = (tmp_path / "cache.json.idx").read_bytes()
+    save_cache([create_test_session("longer-id")], cache_path)
+    (tmp_path / "cache.json.idx").write_bytes(stale_index)
+
+    assert load_cached_session("abc", cache_path) is None
+
+
+def test_invalidate_cache_removes_index(tmp_path):
+    """Test that invalidation deletes the offset index and metadata too."""
+    from cc_fi.core.cache import invalidate_cache
+
+    cache_path = tmp_path / "cache.json"
+    save_cache([create_test_session("abc")], cache_path)
+
+    invalidate_cache(cache_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_cached_metadata_omits_full_content(tmp_path):
+    """Test that the metadata sidecar returns every field but full_content."""
+    from dataclasses import replace
+
+    from cc_fi.core.cache import load_cached_metadata
+
+    cache_path = tmp_path / "cache.json"
+    sessions = [create_test_session("abc"), create_test_session("def", 2000.0)]
+    for session in sessions:
+        session.full_content = "deep content"
+    save_cache(sessions, cache_path, excluded=[create_test_session("old")])
+
+    assert load_cached_metadata(cache_path) == [
+        replace(session, full_content="") for session in sessions
+    ]
+
+
+def test_load_cached_metadata_rejects_stale_sidecar(tmp_path):
+    """Test that a sidecar from an earlier save of equal size isn't trusted."""
+    from cc_fi.core.cache import load_cached_metadata
+
+    cache_path = tmp_path / "cache.json"
+    meta_path = tmp_path / "cache.json.meta"
+    save_cache([create_test_session("abc")], cache_path)
+    stale_meta = meta_path.read_bytes()
+    save_cache([create_test_session("xyz")], cache_path)
+    meta_path.write_bytes(stale_meta)
+
+    assert load_cached_metadata(cache_path) is None
+    assert load_cached_metadata(tmp_path / "missing.json") is None
@@ -304,3 +304,43 @@ def test_content_fingerprint_truncates_long_message():
 
     assert len(fingerprint[1]) == 100
     assert fingerprint[1] == "A" * 100
+
+
+def test_deduplicate_both_matches_sequential_strategies():
+    """Test that fused dedup equals session_id dedup followed by fingerprint."""
+    deduplicator = SessionDeduplicator()
+
+    sessions = [
+        create_test_session(
+            "abc", "2025-11-05T10:00:00", "Message 1", "/Users/foo", 1000.0
+        ),
+        create_test_session(
+            "ghi", "2025-11-05T12:00:00", "Message 3", "/Users/baz", 1200.0
+        ),
+        create_test_session(
+            "abc", "2025-11-05T10:00:00", "Message 1", "/Users/bar", 2000.0
+        ),
+        create_test_session(
+            "def", "2025-11-05T10:00:00", "Message 1", "/Users/bar", 3000.0
+        ),
+        create_test_session(
+            "jkl", "2025-11-05T12:00:00", "Message 3", "/Users/baz", 500.0
+        ),
+    ]
+
+    sequential = deduplicator.deduplicate_by_fingerprint(
+        deduplicator.deduplicate_by_session_id(sessions)
+    )
+    result = deduplicator.deduplicate_both(sessions)
+
+    assert result == sequential
+    assert [s.session_id for s in result] == ["abc", "ghi"]
+
+
+def test_content_fingerprint_is_cached():
+    """Test that content fingerprint is computed once per session."""
+    session = create_test_session(
+        "abc123", "2025-11-05T10:00:00", "Message", "/Users/foo", 1000.0
+    )
+
+    assert session.content_fingerprint is session.content_fingerprint
@@ -116,3 +116,44 @@ def test_parser_integration():
 
     # Should not filter normal messages
     assert not is_boilerplate_message("Normal user message")
+
+
+def test_compiled_regex_agrees_with_matches_pattern():
+    """Test that the compiled regex matches exactly what the registry matches."""
+    from cc_fi.core.filters import matches_pattern
+
+    samples = [
+        "Caveat: test",
+        "  \tTHIS SESSION IS BEING CONTINUED",
+        "foo <command-name>bar",
+        "foo <COMMAND-NAME>bar",
+        "<LOCAL-COMMAND-output>",
+        "<!-- openspec: lower",
+        "prefix [request interrupted by user]",
+        "Normal message with caveat: inside",
+        "",
+    ]
+    for text in samples:
+        expected = any(matches_pattern(text, p) for p in BOILERPLATE_PATTERNS)
+        assert is_boilerplate(text) == expected, text
+
+
+def test_pattern_match_string_lowercased_once():
+    """Test that case-insensitive patterns precompute their lowercase form."""
+    insensitive = BoilerplatePattern("prefix", "Caveat:", case_sensitive=False)
+    sensitive = BoilerplatePattern("comment", "<!-- OPENSPEC:", case_sensitive=True)
+
+    assert insensitive.match_string == "caveat:"
+    assert sensitive.match_string == "<!-- OPENSPEC:"
+
+
+def test_registry_additions_after_import_are_honored():
+    """Test patterns appended to the registry after import are matched."""
+    extra = BoilerplatePattern("prefix", "[automated]", case_sensitive=False)
+    assert not is_boilerplate("[automated] nightly run")
+    BOILERPLATE_PATTERNS.append(extra)
+    try:
+        assert is_boilerplate("[automated] nightly run")
+    finally:
+        BOILERPLATE_PATTERNS.remove(extra)
+    assert not is_boilerplate("[automated] nightly run")
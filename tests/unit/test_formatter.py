@@ -179,3 +179,177 @@ def test_instruction_header_format():
     assert COLOR_OVERLAY0 in result
     assert COLOR_CATPPUCCIN_BLUE in result
     assert COLOR_RESET in result
+
+
+def test_truncate_message_long_whitespace_prefix():
+    """Test truncation when the bounded head collapses below max_length."""
+    msg = " " * 500 + "word " * 50
+    result = truncate_message(msg, 20)
+    assert result == "word word word wo..."
+    assert len(result) == 20
+
+
+def test_truncate_message_very_long():
+    """Test truncation of a message much longer than max_length."""
+    msg = "Line one\n\n" + "x" * 10000
+    result = truncate_message(msg, 20)
+    assert result == "Line one xxxxxxxx..."
+
+
+def test_format_timestamp_aware_datetimes_keep_wall_clock():
+    """Test that equal aware datetimes in different zones format separately."""
+    from datetime import UTC, timedelta, timezone
+
+    utc = datetime(2025, 11, 5, 10, 0, tzinfo=UTC)
+    plus_one = utc.astimezone(timezone(timedelta(hours=1)))
+
+    assert format_timestamp(utc) == "Nov 05, 10:00 AM"
+    assert format_timestamp(plus_one) == "Nov 05, 11:00 AM"
+
+
+def test_format_timestamp_leap_day():
+    """Test formatting of Feb 29."""
+    assert format_timestamp(datetime(2024, 2, 29, 0, 5)) == "Feb 29, 12:05 AM"
+
+
+def test_dynamic_column_widths_cached_until_reset(monkeypatch):
+    """Test that column widths are memoized per render pass."""
+    from cc_fi.core.formatter import (
+        get_dynamic_column_widths,
+        reset_column_width_cache,
+    )
+
+    monkeypatch.setenv("COLUMNS", "150")
+    reset_column_width_cache()
+    narrow = get_dynamic_column_widths()
+
+    monkeypatch.setenv("COLUMNS", "250")
+    assert get_dynamic_column_widths() == narrow
+
+    reset_column_width_cache()
+    wide = get_dynamic_column_widths()
+    assert sum(wide) == sum(narrow) + 100
+    reset_column_width_cache()
+
+
+def test_highlight_fuzzy_matches_positions_survive_long_lowercase():
+    """Test highlighting when lowercasing would change the text length."""
+    from cc_fi.constants import COLOR_BOLD, COLOR_RED, COLOR_RESET
+    from cc_fi.core.formatter import highlight_fuzzy_matches
+
+    result = highlight_fuzzy_matches("İstanbul xyz", "x")
+
+    assert result == f"İstanbul {COLOR_RED}{COLOR_BOLD}x{COLOR_RESET}yz"
+
+
+def test_find_search_matches_positions_survive_long_lowercase():
+    """Test exact match offsets when lowercasing would change the length."""
+    from cc_fi.core.formatter import find_search_matches
+
+    text = "İİ Refactor"
+    matches = find_search_matches(text, "refactor")
+
+    assert [text[start:end] for start, end in matches] == ["Refactor"]
+
+
+def test_find_search_matches_limit():
+    """Test that matching stops after the requested number of matches."""
+    from cc_fi.core.formatter import find_search_matches
+
+    assert find_search_matches("ab ab ab ab", "ab", limit=2) == [(0, 2), (3, 5)]
+
+
+def test_count_search_matches_counts_overlaps():
+    """Test that counting agrees with find_search_matches on overlaps."""
+    from cc_fi.core.formatter import count_search_matches, find_search_matches
+
+    for text, query in [("aaaa", "aa"), ("abab ab", "ab"), ("ababa", "aba")]:
+        assert count_search_matches(text, query) == len(
+            find_search_matches(text, query)
+        )
+
+
+def test_highlight_match_context_marks_exact_span():
+    """Test that only the matched span is highlighted, with ellipses."""
+    from cc_fi.constants import COLOR_BOLD, COLOR_RED, COLOR_RESET
+    from cc_fi.core.formatter import highlight_match_context
+
+    text = "0123456789 match 0123456789"
+    result = highlight_match_context(text, 11, 16, 3)
+
+    assert result == f"...89 {COLOR_RED}{COLOR_BOLD}match{COLOR_RESET} 01..."
+
+
+def test_wrap_text_preserve_colors_ignores_ansi_width():
+    """Test that color codes don't count toward the wrap width."""
+    from cc_fi.constants import COLOR_RED, COLOR_RESET
+    from cc_fi.core.formatter import wrap_text_preserve_colors
+
+    text = f"{COLOR_RED}aaaa{COLOR_RESET} bbbb cccc"
+
+    assert wrap_text_preserve_colors(text, 9).split("\n") == [
+        f"{COLOR_RED}aaaa{COLOR_RESET} bbbb",
+        "cccc",
+    ]
+
+
+def test_shorten_path_requires_directory_boundary():
+    """Test that only the home directory itself and paths under it shorten."""
+    from pathlib import Path
+
+    home = str(Path.home())
+
+    assert shorten_path(home) == "~"
+    assert shorten_path(home + "foo/bar") == home + "foo/bar"
+
+
+def test_header_lines_rendered_once_per_width(monkeypatch):
+    """Test that header and separator are reused for unchanged widths."""
+    import cc_fi.core.formatter as formatter
+
+    monkeypatch.setattr(formatter, "get_dynamic_column_widths", lambda: (30, 40))
+
+    assert formatter.format_list_header() is formatter.format_list_header()
+    assert (
+        formatter.format_header_separator() is formatter.format_header_separator()
+    )
+
+
+def test_normalize_whitespace_collapses_unicode_whitespace():
+    """Test that non-ASCII whitespace collapses like spaces and newlines."""
+    from cc_fi.core.formatter import normalize_whitespace
+
+    assert normalize_whitespace("\u00a0 a\u2003\u2003b \r\n") == "a b"
+    assert normalize_whitespace("already clean") == "already clean"
+
+
+def test_search_preview_without_query_is_browse_preview():
+    """Test that empty or whitespace-only queries show the standard preview."""
+    from pathlib import Path
+
+    from cc_fi.core.formatter import (
+        format_fzf_preview,
+        format_preview_with_query,
+        format_search_preview,
+    )
+    from cc_fi.models.session import SessionData
+
+    session = SessionData(
+        session_id="abc",
+        cwd="/tmp/project",
+        project_name="project",
+        git_branch="main",
+        timestamp=datetime(2025, 11, 5, 10, 0),
+        first_message="first",
+        last_message="last",
+        message_count=2,
+        file_path=Path("/tmp/abc.jsonl"),
+        last_modified=1.0,
+        first_message_full="first",
+        last_message_full="last",
+        full_content="first | last",
+    )
+    expected = format_fzf_preview(session, "")
+
+    assert format_search_preview(session, "") == expected
+    assert format_preview_with_query(session, "   ") == expected
@@ -0,0 +1,96 @@
+"""Unit tests for fzf module."""
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from cc_fi.core.fzf import build_fzf_input, iter_fzf_rows, run_fzf_selection
+from cc_fi.models.session import SessionData
+
+
+def create_test_session(session_id: str) -> SessionData:
+    """Helper to create test SessionData."""
+    return SessionData(
+        session_id=session_id,
+        cwd="/tmp/project",
+        project_name="project",
+        git_branch="main",
+        timestamp=datetime(2025, 11, 5, 10, 0),
+        first_message="first",
+        last_message="last",
+        message_count=2,
+        file_path=Path(f"/tmp/{session_id}.jsonl"),
+        last_modified=1.0,
+        first_message_full="first message",
+        last_message_full="last message",
+        full_content="first message | last message",
+    )
+
+
+@pytest.fixture
+def fake_fzf(tmp_path, monkeypatch):
+    """Install a stand-in fzf script on PATH; returns a writer for its body."""
+
+    def install(body: str) -> None:
+        script = tmp_path / "fzf"
+        script.write_text(f"#!/bin/sh\n{body}\n")
+        script.chmod(0o755)
+
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return install
+
+
+def test_build_fzf_input_joins_streamed_rows():
+    """Test that the joined input matches the streamed rows."""
+    sessions = [create_test_session("aaa"), create_test_session("bbb")]
+
+    rows = list(iter_fzf_rows(sessions))
+
+    assert build_fzf_input(sessions) == "\n".join(rows)
+    assert [row.split("|", 1)[0] for row in rows] == [
+        "INSTRUCTION1",
+        "INSTRUCTION2",
+        "HEADER",
+        "SEPARATOR",
+        "aaa",
+        "bbb",
+    ]
+
+
+def test_run_fzf_selection_returns_selected_session(fake_fzf):
+    """Test that the line fzf prints maps back to its session."""
+    fake_fzf("grep '^bbb|'")
+    sessions = [create_test_session("aaa"), create_test_session("bbb")]
+
+    assert run_fzf_selection(sessions) is sessions[1]
+
+
+def test_run_fzf_selection_tolerates_early_exit(fake_fzf):
+    """Test that fzf exiting before reading all input doesn't raise."""
+    fake_fzf("exit 130")
+    sessions = [create_test_session(f"s{i}") for i in range(2000)]
+
+    assert run_fzf_selection(sessions) is None
+
+
+def test_iter_fzf_rows_hidden_column_is_content_only():
+    """Test that the off-screen search text doesn't repeat the display row."""
+    from cc_fi.core.formatter import format_list_row
+
+    session = create_test_session("aaa")
+    row = list(iter_fzf_rows([session]))[-1]
+
+    display, hidden = row.split("|", 1)[1].split(" " * 200, 1)
+    assert display == format_list_row(session)
+    assert hidden == "first message   last message"
+
+
+def test_run_fzf_selection_survives_unencodable_content(fake_fzf):
+    """Test that a lone surrogate in a transcript doesn't abort selection."""
+    fake_fzf("grep '^bbb|'")
+    sessions = [create_test_session("aaa"), create_test_session("bbb")]
+    sessions[0].full_content = "broken \ud800 surrogate"
+
+    assert run_fzf_selection(sessions) is sessions[1]
@@ -0,0 +1,100 @@
+"""Unit tests for indexer module."""
+
+import json
+import os
+
+import pytest
+
+import cc_fi.core.indexer as indexer
+from cc_fi.core.indexer import index_sessions
+
+
+def write_session_file(path, text: str) -> None:
+    """Helper to write a minimal one-message session file."""
+    line = {
+        "type": "user",
+        "timestamp": "2025-11-05T10:00:00Z",
+        "message": {"content": text},
+    }
+    path.write_text(json.dumps(line) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def projects_dir(tmp_path, monkeypatch):
+    """Projects directory with two session files, patched into the indexer."""
+    project = tmp_path / "-home-user-project"
+    project.mkdir()
+    write_session_file(project / "aaa.jsonl", "first session")
+    write_session_file(project / "bbb.jsonl", "second session")
+    write_session_file(project / "agent-ccc.jsonl", "agent session")
+    monkeypatch.setattr(indexer, "CLAUDE_PROJECTS_DIR", tmp_path)
+    return project
+
+
+def test_index_sessions_skips_agent_files(projects_dir):
+    """Test that agent session files are not indexed."""
+    sessions = index_sessions()
+
+    assert sorted(s.session_id for s in sessions) == ["aaa", "bbb"]
+
+
+def test_index_sessions_reuses_unchanged_files(projects_dir):
+    """Test that files with unchanged mtime reuse their previous entry."""
+    first = {str(s.file_path): s for s in index_sessions()}
+
+    changed = projects_dir / "bbb.jsonl"
+    write_session_file(changed, "edited session")
+    stat = changed.stat()
+    os.utime(changed, (stat.st_atime, stat.st_mtime + 10))
+
+    second = {s.session_id: s for s in index_sessions(previous=first)}
+
+    assert second["aaa"] is first[str(projects_dir / "aaa.jsonl")]
+    assert second["bbb"] is not first[str(changed)]
+    assert second["bbb"].first_message == "edited session"
+
+
+def test_index_sessions_force_rebuild_ignores_previous(projects_dir):
+    """Test that force_rebuild re-parses even unchanged files."""
+    first = {str(s.file_path): s for s in index_sessions()}
+
+    second = index_sessions(force_rebuild=True, previous=first)
+
+    assert all(s is not first[str(s.file_path)] for s in second)
+
+
+def test_parse_session_files_parallel_matches_serial(projects_dir, monkeypatch):
+    """Test that worker-process parsing yields the same sessions as serial."""
+    files = sorted(projects_dir.glob("[!a]*.jsonl")) + [projects_dir / "aaa.jsonl"]
+    (projects_dir / "broken.jsonl").write_text("not json\n", encoding="utf-8")
+    files.append(projects_dir / "broken.jsonl")
+
+    serial = indexer.parse_session_files(files)
+
+    monkeypatch.setattr(indexer, "PARALLEL_PARSE_MIN_FILES", 1)
+    monkeypatch.setattr(indexer.os, "cpu_count", lambda: 2)
+    parallel = indexer.parse_session_files(files)
+
+    assert [s.session_id for s in parallel] == ["bbb", "aaa"]
+    assert parallel == serial
+
+
+def test_find_session_files_matches_rglob(tmp_path):
+    """Test that the scandir walk finds the same files as rglob would."""
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (nested / "deep.jsonl").write_text("{}\n")
+    (tmp_path / "a" / "agent-x.jsonl").write_text("{}\n")
+    (tmp_path / "a" / "notes.txt").write_text("")
+    (tmp_path / "dir.jsonl").mkdir()
+    (tmp_path / "dir.jsonl" / "inner.jsonl").write_text("{}\n")
+    (tmp_path / "top.jsonl").write_text("{}\n")
+
+    expected = sorted(
+        p
+        for p in tmp_path.rglob("*.jsonl")
+        if indexer.is_session_file(p)
+    )
+
+    assert sorted(indexer.find_session_files(tmp_path)) == expected
+    assert len(expected) == 3
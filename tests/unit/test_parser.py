@@ -140,3 +140,70 @@ def test_is_tool_result_message_multiple_tool_results():
         }
     }
     assert is_tool_result_message(data) is True
+
+
+def test_extract_all_user_messages_decodes_unicode_and_skips_bad_lines(tmp_path):
+    """Test that non-ASCII text and lone surrogates survive, bad lines don't."""
+    from cc_fi.core.parser import extract_all_user_messages
+
+    session_file = tmp_path / "session.jsonl"
+    lines = [
+        json.dumps({"type": "user", "message": {"content": "héllo wörld"}}),
+        "not json",
+        json.dumps({"type": "user", "message": {"content": "broken \ud800 text"}}),
+    ]
+    session_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    assert extract_all_user_messages(session_file) == (
+        "héllo wörld | broken \ud800 text"
+    )
+
+
+def test_extract_project_name_matches_path_name():
+    """Test that edge-case paths resolve the same as Path(cwd).name."""
+    cwds = ["", ".", "a", "/a//b//", "a/b/.", "a/./b", "/a/..", "./", "/x/.hidden"]
+    for cwd in cwds:
+        assert extract_project_name(cwd) == Path(cwd).name, cwd
+
+
+def test_extract_metadata_single_read_matches_file_readers(tmp_path):
+    """Test that the one-read metadata path agrees with the per-field readers."""
+    from cc_fi.core.parser import (
+        count_messages,
+        extract_all_user_messages,
+        extract_metadata_from_file,
+        parse_first_user_message,
+        parse_last_user_message,
+    )
+
+    def user(content):
+        return json.dumps(
+            {
+                "type": "user",
+                "timestamp": "2025-11-05T10:00:00Z",
+                "message": {"content": content},
+            }
+        )
+
+    session_file = tmp_path / "-home-user-project" / "abc.jsonl"
+    session_file.parent.mkdir()
+    lines = [
+        user("Caveat: boilerplate first"),
+        user("real first"),
+        json.dumps({"type": "assistant", "message": {"content": "reply"}}),
+        "[1, 2]",
+        "",
+        user([{"type": "tool_result", "content": "output"}]),
+        user("real last"),
+    ]
+    session_file.write_bytes(("\r\n".join(lines) + "\n").encode("utf-8"))
+
+    session = extract_metadata_from_file(session_file)
+
+    assert session.first_message == parse_first_user_message(session_file)[1]
+    assert session.first_message == "real first"
+    assert session.last_message == parse_last_user_message(session_file, 100)
+    assert session.last_message == "real last"
+    assert session.message_count == count_messages(session_file) == len(lines)
+    assert session.full_content == extract_all_user_messages(session_file)
+    assert session.full_content == "real first | real last"
@@ -101,3 +101,97 @@ def test_filter_sessions_with_term():
     result = filter_sessions(sessions, "alpha")
     assert len(result) == 1
     assert result[0].project_name == "alpha"
+
+
+def test_full_content_lower_is_cached():
+    """Test that lowercased deep-search content is computed once."""
+    session = SessionData(
+        session_id="abc123",
+        cwd="/Users/test/project",
+        project_name="project",
+        git_branch="",
+        timestamp=datetime.now(),
+        first_message="Hello",
+        last_message="Goodbye",
+        message_count=10,
+        file_path=Path("/tmp/test.jsonl"),
+        last_modified=0.0,
+        full_content="Deep CONTENT here",
+    )
+
+    assert session.full_content_lower == "deep content here"
+    assert session.full_content_lower is session.full_content_lower
+    assert matches_search_term(session, "Content")
+
+
+def test_build_session_index_maps_ids():
+    """Test that the index resolves the same sessions as get_session_by_id."""
+    from cc_fi.core.search import build_session_index, get_session_by_id
+
+    sessions = [
+        SessionData(
+            session_id=session_id,
+            cwd="/Users/test/project",
+            project_name="project",
+            git_branch="",
+            timestamp=datetime.now(),
+            first_message="Hello",
+            last_message="Goodbye",
+            message_count=1,
+            file_path=Path(f"/tmp/{session_id}.jsonl"),
+            last_modified=0.0,
+        )
+        for session_id in ("abc", "def")
+    ]
+
+    index = build_session_index(sessions)
+
+    assert index["def"] is get_session_by_id(sessions, "def")
+    assert index.get("missing") is None
+
+
+def test_matches_search_term_does_not_span_fields():
+    """Test that a term can't match across two adjacent metadata fields."""
+    session = SessionData(
+        session_id="abc123",
+        cwd="/Users/test/project",
+        project_name="project",
+        git_branch="main",
+        timestamp=datetime.now(),
+        first_message="Hello",
+        last_message="Goodbye",
+        message_count=10,
+        file_path=Path("/tmp/test.jsonl"),
+        last_modified=0.0,
+    )
+
+    assert matches_search_term(session, "MAIN")
+    assert not matches_search_term(session, "mainhello")
+    assert not matches_search_term(session, "main hello")
+
+
+def test_replaced_session_recomputes_search_haystacks():
+    """Test that memoized lowercase text doesn't leak into replaced copies."""
+    from dataclasses import replace
+
+    session = SessionData(
+        session_id="abc123",
+        cwd="/Users/test/project",
+        project_name="project",
+        git_branch="",
+        timestamp=datetime.now(),
+        first_message="Hello",
+        last_message="Goodbye",
+        message_count=10,
+        file_path=Path("/tmp/test.jsonl"),
+        last_modified=0.0,
+        full_content="old text",
+    )
+    assert matches_search_term(session, "old")
+
+    updated = replace(session, project_name="renamed", full_content="new text")
+
+    assert matches_search_term(updated, "renamed")
+    assert matches_search_term(updated, "new")
+    assert not matches_search_term(updated, "old")
+    assert not hasattr(updated, "__dict__")